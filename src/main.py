@@ -1,20 +1,24 @@
 """LangGraph 챗봇 CLI 진입점"""
 
-import asyncio
 import typer
 from typing_extensions import Annotated
 from pathlib import Path
 from typing import Optional
 
 # 프로젝트 모듈 import
+# (명령어 모듈은 langchain/rich 등 무거운 의존성을 끌어오므로 각 명령어 내부에서 지연 import)
 from my_mcp.config import check_settings, get_openai_config, get_chatbot_config, get_version, get_mcp_servers
 from my_mcp.logging import setup_logging
-from my_mcp.utils import OutputFormat, CommonOptions, output_result
-from my_mcp.commands import ChatCommand, InfoCommand, SetupCommand, ExportCommand
+from my_mcp.utils.output_utils import OutputFormat, CommonOptions, OPTIONS, output_result
 
 
-# 전역 상태 저장
-state = {"options": None}
+def _discard_output(*args, **kwargs):
+    """조용한 모드용 출력 함수 (아무것도 출력하지 않음)"""
+
+
+# 현재 옵션에 맞는 출력 함수 (main_callback에서 바인딩, 딕셔너리 조회 없이 바로 호출)
+# 공통 옵션은 OPTIONS 컨텍스트 변수에 저장
+_output = output_result
 
 # Agent 하위 커맨드 그룹 생성
 agent_app = typer.Typer(help="LangGraph 에이전트 관리 명령어", rich_markup_mode="markdown")
@@ -31,6 +35,7 @@ def export_graph(
     ai_description: Annotated[bool, typer.Option("--ai-description", help="AI가 그래프 구조 설명을 자동 생성")] = False
 ):
     """LangGraph 그래프 구조를 내보냅니다."""
+    from my_mcp.commands import ExportCommand
     
     # 설정 파일 확인
     if not check_settings():
@@ -59,12 +64,16 @@ def main_callback(
     config_file: Annotated[str, typer.Option("--config", "-c", help="설정 파일 경로")] = None,
 ):
     """공통 옵션 설정"""
-    state["options"] = CommonOptions(
+    global _output
+    OPTIONS.set(CommonOptions(
         verbose = verbose,
         quiet = quiet,
         output_format = output_format,
         config_file = config_file
-    )
+    ))
+    
+    # 조용한 모드면 출력 함수 자체를 no-op으로 바인딩 (호출마다 quiet 검사를 하지 않도록)
+    _output = _discard_output if quiet else output_result
     
     # loguru 로깅 설정
     setup_logging()
@@ -89,6 +98,8 @@ def chat(
     - my-mcp chat --once → 일회성 대화 (질문 입력 후 종료)
     - my-mcp chat --once "질문내용" → 일회성 대화 (명시적)
     """
+    import asyncio
+    from my_mcp.commands import ChatCommand
     
     # 설정 파일 확인
     if not check_settings():
@@ -128,7 +139,9 @@ def chat(
 @app.command()
 def info():
     """LangGraph 챗봇 정보를 출력합니다."""
-    options = state["options"]
+    from my_mcp.commands import InfoCommand
+    
+    options = OPTIONS.get(None)
     version = get_version()
     
     info_command = InfoCommand(version)
@@ -140,13 +153,14 @@ def version():
     """버전 정보를 출력합니다."""
     version = get_version()
     message = f"LangGraph 챗봇 v{version}"
-    options = state["options"]
-    output_result(message, options=options)
+    _output(message)
 
 
 @app.command()
 def setup():
     """설정 파일을 생성합니다."""
+    from my_mcp.commands import SetupCommand
+    
     project_root = Path(__file__).parent.parent
     setup_command = SetupCommand(project_root)
     setup_command.execute()
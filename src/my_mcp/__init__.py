@@ -1,5 +1,9 @@
 """My MCP CLI 패키지"""
 
+import functools
+
+
+@functools.lru_cache(maxsize=1)
 def _get_version():
     """버전 정보를 동적으로 가져옵니다."""
     try:
@@ -25,4 +29,9 @@ def _get_version():
     except Exception:
         return "0.0.0"
 
-__version__ = _get_version()
+
+def __getattr__(name):
+    """__version__은 처음 접근할 때 한 번만 pyproject.toml을 읽어 계산합니다."""
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,6 @@
 LangGraph 기반 AI 에이전트 모듈
 """
 
-from .service import AgentService, create_agent_service
+from .service import AgentService, create_agent_service, get_agent_service
 
-__all__ = ["AgentService", "create_agent_service"] 
\ No newline at end of file
+__all__ = ["AgentService", "create_agent_service", "get_agent_service"] 
\ No newline at end of file
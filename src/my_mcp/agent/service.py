@@ -1,13 +1,17 @@
 """
 LangGraph를 사용한 AI 에이전트 서비스
 """
-from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import re
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
+from langchain_core.caches import InMemoryCache
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
-from langchain_core.messages import ToolMessage
+from langchain_core.messages import AIMessageChunk, ToolMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode
+from langgraph.prebuilt import ToolNode, tools_condition
 from typing_extensions import Annotated, TypedDict
 from ..logging import get_logger
 from ..tools import get_tool_registry
@@ -16,13 +20,191 @@ from ..mcp import mcp_registry, mcp_client_manager
 # 서비스 전용 로거 생성
 logger = get_logger("my_mcp.agent.service")
 
+# 헤더로 인정하는 최대 '#' 개수 (마크다운 h1~h6)
+_MAX_HEADER_LEVEL = 6
+
+
+def _is_markdown_header(line: str) -> bool:
+    """줄이 마크다운 헤더('# ' ~ '###### ')로 시작하는지 확인"""
+    level = len(line) - len(line.lstrip('#'))
+    return 1 <= level <= _MAX_HEADER_LEVEL and line[level:level + 1].isspace()
+
+
+def _find_bold_spans(line: str) -> List[Tuple[int, int]]:
+    """
+    한 줄에서 **굵은 텍스트** 구간을 왼쪽부터 찾습니다.
+
+    Args:
+        line: 검사할 한 줄
+
+    Returns:
+        (시작, 끝) 인덱스 목록 (끝은 닫는 '**' 다음 위치)
+    """
+    spans = []
+    start = line.find('**')
+    while start != -1:
+        # 여는 '**' 뒤에 '*'가 아닌 문자가 하나 이상 있고 곧바로 '**'로 닫혀야 함
+        close = line.find('*', start + 2)
+        if close > start + 2 and line.startswith('**', close):
+            spans.append((start, close + 2))
+            start = line.find('**', close + 2)
+        else:
+            start = line.find('**', start + 1)
+    return spans
+
+
+def _space_bold_text(line: str) -> List[str]:
+    """
+    굵은 텍스트 앞뒤 공백을 한 칸으로 맞추고, 공백만 사이에 둔 연속 굵은 텍스트는 빈 줄로 분리합니다.
+
+    Args:
+        line: 처리할 한 줄
+
+    Returns:
+        처리된 줄 목록 (분리가 없으면 한 줄)
+    """
+    spans = _find_bold_spans(line)
+    if not spans:
+        return [line]
+
+    lines: List[str] = []
+    current: List[str] = []
+    previous_end = 0
+    for start, end in spans:
+        gap = line[previous_end:start]
+        if previous_end == 0:
+            # 줄 앞부분: 공백이 아닌 문자 뒤라면 한 칸 띄움
+            current.append(gap.rstrip() + ' ' if gap.strip() else gap)
+        elif gap.strip():
+            current.append(' ' + gap.strip() + ' ')
+        else:
+            # 굵은 텍스트가 연달아 오면 빈 줄로 분리
+            lines.append(''.join(current))
+            lines.append('')
+            current = []
+        current.append(line[start:end])
+        previous_end = end
+
+    tail = line[previous_end:]
+    current.append(' ' + tail.lstrip() if tail.strip() else tail)
+    lines.append(''.join(current))
+    return lines
+
+
+# 스트리밍 분할용 정규식: 마크다운 구문(**텍스트**, *텍스트*, `코드`)은 하나의 토큰으로 유지 (앞뒤 공백 포함)
+_STREAM_TOKEN_RE = re.compile(r'\s*(?:\*\*[^*]+\*\*|\*[^*]+\*|`[^`]+`|[^\s]+)\s*')
+# 마크다운 구문이 없는 일반 텍스트용: 대안(alternation) 없이 단어와 주변 공백만 매칭
+_PLAIN_STREAM_TOKEN_RE = re.compile(r'\s*\S+\s*')
+
+# 도구 표시 이름에서 대문자로 유지할 일반적인 약어 (title() 적용 후 형태, 단어 단위로만 매칭)
+_ABBREVIATION_RE = re.compile(r'\b(?:Api|Url|Id|Uuid|Json|Xml|Http|Https)\b')
+
+# 완성된 응답을 나눠 전달할 때 한 번에 보낼 최소 문자 수 (이벤트 루프 전환 횟수 감소)
+_FALLBACK_CHUNK_CHARS = 64
+
+# LLM 캐시 키(직렬화된 메시지 목록)에서 메시지 id 항목을 찾는 패턴
+# (직렬화된 메시지는 "type" 다음에 "id"가 오며, 도구 호출의 "id"는 "type" 앞에 있어 매칭되지 않음.
+#  메시지 본문 안의 따옴표는 \"로 이스케이프되므로 본문 텍스트와도 매칭되지 않음)
+_SERIALIZED_MESSAGE_ID_RE = re.compile(r'("type": "[a-z]+"), "id": "[^"\\]*"')
+
+
+class _MessageIdInsensitiveCache(InMemoryCache):
+    """
+    메시지 id를 무시하고 대화 내용으로만 응답을 찾는 LLM 응답 캐시
+    
+    add_messages가 매 턴 새 UUID를 부여하고 LangChain 캐시 키에 메시지 id가 포함되므로,
+    id를 지우지 않으면 같은 대화 내용이어도 캐시가 적중하지 않습니다.
+    메시지 객체를 복사하지 않고 LangChain이 이미 만든 캐시 키 문자열에서만 id를 제거합니다.
+    """
+    
+    def lookup(self, prompt: str, llm_string: str):
+        return super().lookup(_SERIALIZED_MESSAGE_ID_RE.sub(r'\1', prompt), llm_string)
+    
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        super().update(_SERIALIZED_MESSAGE_ID_RE.sub(r'\1', prompt), llm_string, return_val)
+
+
+# LLM 응답 캐시 (temperature가 0인 결정적 설정에서 openai.cache가 켜져 있을 때만 사용)
+# 같은 메시지 목록이면 API 호출을 생략하며, 대화 턴/도구 결과가 모두 키에 포함되므로
+# 도구 호출 턴도 도구는 매번 실제로 실행되고 그 결과에 이어지는 생성만 재사용됨 (실패한 생성은 저장되지 않음)
+_LLM_RESPONSE_CACHE = _MessageIdInsensitiveCache(maxsize=256)
+
+
+# LLM 클라이언트/도구 바인딩 캐시 (도구 JSON 스키마 직렬화와 HTTP 클라이언트 생성을 재사용)
+# 도구 구성이 바뀔 때마다 항목이 늘어나지 않도록 최근 사용 순으로 최대 개수만 유지
+_LLM_CACHE_SIZE = 8
+_llm_cache: OrderedDict[tuple, Tuple[ChatOpenAI, Any]] = OrderedDict()
+
+
+def _get_llm_with_tools(openai_config: Dict[str, Any], tools: List[Any]) -> Tuple[ChatOpenAI, Any]:
+    """
+    설정과 도구 구성에 맞는 LLM과 도구 바인딩된 LLM을 반환
+    
+    Args:
+        openai_config: OpenAI API 설정
+        tools: 바인딩할 도구 목록
+        
+    Returns:
+        (LLM, 도구 바인딩된 LLM) 튜플
+    """
+    # 무작위성이 있는 설정(temperature > 0)의 응답은 캐시하지 않음
+    use_response_cache = openai_config.get("cache", True) and openai_config["temperature"] == 0
+    
+    cache_key = (
+        openai_config["api_key"],
+        openai_config["model"],
+        openai_config["temperature"],
+        openai_config["max_tokens"],
+        openai_config.get("streaming", True),
+        use_response_cache,
+        tuple(tool.name for tool in tools),
+    )
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        _llm_cache.move_to_end(cache_key)
+        return cached
+    
+    llm = ChatOpenAI(
+        api_key=openai_config["api_key"],
+        model=openai_config["model"],
+        temperature=openai_config["temperature"],
+        max_tokens=openai_config["max_tokens"],
+        streaming=openai_config.get("streaming", True),
+        cache=_LLM_RESPONSE_CACHE if use_response_cache else None
+    )
+    
+    # LLM에 도구 바인딩
+    if tools:
+        llm_with_tools = llm.bind_tools(tools)
+        logger.debug(f"도구 바인딩 완료: {len(tools)}개 도구")
+    else:
+        llm_with_tools = llm
+        logger.debug("사용 가능한 도구가 없습니다")
+    
+    _llm_cache[cache_key] = (llm, llm_with_tools)
+    if len(_llm_cache) > _LLM_CACHE_SIZE:
+        _llm_cache.popitem(last=False)
+    return llm, llm_with_tools
+
+
 class AgentState(TypedDict):
     """에이전트 상태를 나타내는 타입"""
     messages: Annotated[List[Any], add_messages]
-    system_prompt: str
     user_input: str
     ai_response: str
     tool_calls: List[Dict[str, Any]]  # 도구 호출 정보 저장
+    has_tool_calls: bool  # 마지막 응답에 도구 호출이 있는지 여부 (스트리밍 중 도구 실행 알림용)
+
+# 워크플로우 실행 자체가 실패했을 때 사용자에게 보여줄 메시지
+_REQUEST_ERROR_MESSAGE = "죄송합니다. 요청을 처리하는 중에 오류가 발생했습니다."
+
+# 매 턴 초기 상태의 고정 기본값 (시스템 프롬프트는 상태가 아닌 서비스 속성으로 관리)
+_INITIAL_STATE_TEMPLATE: Dict[str, Any] = {
+    "ai_response": "",
+    "tool_calls": [],
+    "has_tool_calls": False
+}
+
 
 class AgentService:
     """LangGraph 기반 AI 에이전트 서비스"""
@@ -41,28 +223,18 @@ class AgentService:
         
         # MCP 서버 초기화
         self.mcp_servers = mcp_servers or []
+        self._mcp_connection_results: Dict[str, bool] = {}
         self._initialize_mcp_servers()
         
         # 도구 레지스트리 초기화
         self.tool_registry = get_tool_registry()
         self.tools = self.tool_registry.get_enabled_tools()
+        # 내장 도구 목록 (MCP 재연결 시 이전 MCP 도구가 중복 추가되지 않도록 기준으로 사용)
+        self._builtin_tools = list(self.tools)
+        self._reset_tool_lookup()
         
-        # LLM 초기화 (도구 바인딩 포함)
-        self.llm = ChatOpenAI(
-            api_key=openai_config["api_key"],
-            model=openai_config["model"],
-            temperature=openai_config["temperature"],
-            max_tokens=openai_config["max_tokens"],
-            streaming=openai_config.get("streaming", True)
-        )
-        
-        # LLM에 도구 바인딩
-        if self.tools:
-            self.llm_with_tools = self.llm.bind_tools(self.tools)
-            logger.debug(f"도구 바인딩 완료: {len(self.tools)}개 도구")
-        else:
-            self.llm_with_tools = self.llm
-            logger.debug("사용 가능한 도구가 없습니다")
+        # LLM 초기화 및 도구 바인딩 (같은 설정/도구 구성이면 캐시 재사용)
+        self.llm, self.llm_with_tools = _get_llm_with_tools(openai_config, self.tools)
         
         # 도구 노드 생성
         self.tool_node = ToolNode(self.tools) if self.tools else None
@@ -71,8 +243,12 @@ class AgentService:
         self.workflow = self._create_workflow()
         self.app = self.workflow.compile()
         
-        # 시스템 프롬프트 설정
+        # 그래프 구조 캐시: (컴파일된 앱, 그래프)
+        self._graph_cache: Optional[Tuple[Any, Any]] = None
+        
+        # 시스템 프롬프트 설정 (첫 턴마다 재사용할 SystemMessage도 미리 생성)
         self.system_prompt = agent_config["system_prompt"]
+        self._system_message = SystemMessage(content=self.system_prompt)
         
         logger.debug(f"AI 에이전트 서비스 초기화 완료: {agent_config['name']}")
     
@@ -97,6 +273,10 @@ class AgentService:
     
     async def connect_mcp_servers(self) -> Dict[str, bool]:
         """MCP 서버들에 연결"""
+        # 캐시된 서비스 재사용 시 도구가 중복 통합되지 않도록 기존 연결 결과 반환
+        if self._mcp_connection_results:
+            return self._mcp_connection_results
+        
         try:
             # 공식 MCP 관리자 초기화
             success = await mcp_client_manager.initialize()
@@ -105,10 +285,11 @@ class AgentService:
                 # MCP 도구 통합
                 await self._integrate_mcp_tools()
                 
-                # 연결 성공한 서버 목록
-                servers = mcp_registry.get_enabled_servers()
-                connection_results = {server.name: True for server in servers}
-                logger.info(f"MCP 서버 연결 성공: {len(servers)}개 서버")
+                # 서버별 연결 결과 (일부 서버가 실패해도 나머지 서버의 도구는 사용)
+                connection_results = mcp_client_manager.get_connection_results()
+                self._mcp_connection_results = connection_results
+                connected_count = sum(1 for connected in connection_results.values() if connected)
+                logger.info(f"MCP 서버 연결 성공: {connected_count}/{len(connection_results)}개 서버")
                 
                 return connection_results
             else:
@@ -120,34 +301,87 @@ class AgentService:
             return {}
     
     async def _integrate_mcp_tools(self) -> None:
-        """MCP 도구를 기존 도구 목록에 통합"""
+        """
+        MCP 도구를 기존 도구 목록에 통합
+        
+        도구 노드(그래프)를 먼저 갱신하고, 성공한 경우에만 도구 목록과 LLM 바인딩을 교체합니다.
+        (중간에 실패해도 LLM이 호출하는 도구를 그래프가 실행하지 못하는 상태가 되지 않음)
+        """
         try:
             # 공식 라이브러리에서 도구 가져오기
             mcp_tools = mcp_client_manager.get_tools()
             
-            if mcp_tools:
-                # 기존 도구와 MCP 도구를 합치기
-                combined_tools = list(self.tools) + mcp_tools
-                self.tools = combined_tools
-                
-                # LLM에 다시 바인딩
-                self.llm_with_tools = self.llm.bind_tools(self.tools)
-                
-                # 도구 노드 다시 생성
-                self.tool_node = ToolNode(self.tools)
-                
-                # 워크플로우 재생성
-                self.workflow = self._create_workflow()
-                self.app = self.workflow.compile()
-                
-                logger.info(f"MCP 도구 통합 완료: {len(mcp_tools)}개 도구 추가")
-                
+            # 추가할 도구가 없으면 기존 바인딩과 워크플로우를 그대로 사용
+            if not mcp_tools:
+                return
+            
+            # 내장 도구와 MCP 도구를 합치기 (재연결 시 이전 MCP 도구는 새 도구로 대체)
+            tools = self._builtin_tools + mcp_tools
+            
+            if self.tool_node:
+                # 컴파일된 그래프가 같은 도구 노드를 참조하므로 노드의 도구 목록만 확장 (재컴파일 불필요)
+                self._extend_tool_node(mcp_tools)
+            else:
+                # 도구 노드가 없던 그래프는 구조가 바뀌므로 한 번만 재생성 (실패하면 기존 그래프 유지)
+                self.tool_node = ToolNode(tools)
+                try:
+                    workflow = self._create_workflow()
+                    app = workflow.compile()
+                except Exception:
+                    self.tool_node = None
+                    raise
+                self.workflow, self.app = workflow, app
+            
+            # 그래프가 새 도구를 실행할 수 있게 된 뒤에 LLM에 다시 바인딩 (같은 도구 구성이면 캐시된 바인딩 재사용)
+            self.llm, self.llm_with_tools = _get_llm_with_tools(self.openai_config, tools)
+            self.tools = tools
+            self._reset_tool_lookup()
+            
+            logger.info(f"MCP 도구 통합 완료: {len(mcp_tools)}개 도구 추가")
+            
         except Exception as e:
             logger.error(f"MCP 도구 통합 오류: {e}")
     
+    def _extend_tool_node(self, tools: List[Any]) -> None:
+        """
+        기존 도구 노드에 도구를 추가합니다.
+        
+        Args:
+            tools: 추가할 도구 목록
+        """
+        # ToolNode가 도구별로 준비하는 조회 테이블을 새로 만든 뒤 기존 노드에 병합
+        extension = ToolNode(tools)
+        self.tool_node.tools_by_name.update(extension.tools_by_name)
+        self.tool_node.tool_to_state_args.update(extension.tool_to_state_args)
+        self.tool_node.tool_to_store_arg.update(extension.tool_to_store_arg)
+    
+    async def warm_up_connection(self, timeout: float = 3.0) -> bool:
+        """
+        OpenAI API 연결을 미리 수립 (TLS 핸드셰이크 및 커넥션 풀 준비)
+        토큰을 소모하지 않는 모델 조회 요청을 사용합니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            연결 준비 성공 여부
+        """
+        try:
+            # 워크플로우 노드는 동기 클라이언트(invoke)를 사용하므로 동기 클라이언트의 커넥션 풀을 준비
+            client = self.llm.root_client.with_options(timeout=timeout, max_retries=0)
+            await asyncio.to_thread(client.models.retrieve, self.openai_config["model"])
+            logger.debug("OpenAI API 연결 준비 완료")
+            return True
+        except Exception as e:
+            # 응답이 오류여도 연결 자체는 재사용되므로 실패는 무시
+            logger.debug(f"OpenAI API 연결 준비 실패 (무시): {e}")
+            return False
+    
     async def disconnect_mcp_servers(self) -> None:
         """MCP 서버들 연결 해제"""
         await mcp_client_manager.close()
+        # 캐시된 서비스가 다시 연결할 때 이전 연결 결과를 재사용하지 않도록 초기화
+        self._mcp_connection_results = {}
         logger.info("모든 MCP 서버 연결 해제 완료")
     
     def _create_workflow(self) -> StateGraph:
@@ -158,7 +392,6 @@ class AgentService:
         # 노드 추가
         workflow.add_node("process_input", self._process_input)
         workflow.add_node("generate_response", self._generate_response)
-        workflow.add_node("format_output", self._format_output)
         
         # 도구 사용 시 도구 노드 추가
         if self.tool_node:
@@ -167,21 +400,19 @@ class AgentService:
         # 엣지 추가
         workflow.add_edge("process_input", "generate_response")
         
-        # 도구 사용 여부에 따른 조건부 엣지 추가
+        # 도구 사용 여부에 따른 조건부 엣지 추가 (마지막 AI 메시지에 도구 호출이 있으면 "tools")
         if self.tool_node:
             workflow.add_conditional_edges(
                 "generate_response",
-                self._should_call_tools,
+                tools_condition,
                 {
-                    "call_tools": "call_tools",
-                    "format_output": "format_output"
+                    "tools": "call_tools",
+                    END: END
                 }
             )
             workflow.add_edge("call_tools", "generate_response")
         else:
-            workflow.add_edge("generate_response", "format_output")
-        
-        workflow.add_edge("format_output", END)
+            workflow.add_edge("generate_response", END)
         
         # 시작점 설정
         workflow.set_entry_point("process_input")
@@ -190,25 +421,18 @@ class AgentService:
     
     def _process_input(self, state: AgentState) -> Dict[str, Any]:
         """사용자 입력 처리"""
-        user_input = state.get("user_input", "")
-        
-        # 메시지 목록에 사용자 입력 추가
-        messages = state.get("messages", [])
+        # 초기 상태(_build_initial_state)에 항상 포함되는 채널이므로 기본값 없이 바로 읽음
+        user_input = state["user_input"]
+        user_message = HumanMessage(content=user_input)
         
+        # 새로 추가할 메시지만 반환 (기존 목록에 합치는 것은 add_messages 리듀서가 처리)
         # 첫 번째 메시지인 경우 시스템 프롬프트 추가
-        if not messages:
-            messages.append(SystemMessage(content=self.system_prompt))
-        
-        # 사용자 메시지 추가
-        messages.append(HumanMessage(content=user_input))
+        new_messages = [user_message] if state["messages"] else [self._system_message, user_message]
         
-        logger.debug(f"사용자 입력 처리: {user_input}")
+        logger.debug("사용자 입력 처리: {}", user_input)
         
-        return {
-            "messages": messages,
-            "user_input": user_input,
-            "system_prompt": self.system_prompt
-        }
+        # 변경되는 채널만 기록 (user_input은 초기 상태 값을 그대로 유지)
+        return {"messages": new_messages}
     
     def _generate_response(self, state: AgentState) -> Dict[str, Any]:
         """AI 응답 생성"""
@@ -218,67 +442,48 @@ class AgentService:
             # 도구 바인딩된 LLM을 사용하여 응답 생성
             response = self.llm_with_tools.invoke(messages)
             
-            # 응답을 메시지 목록에 추가
-            messages.append(response)
-            
-            # 응답 내용 추출
-            ai_response = response.content if response.content else ""
+            # 응답 내용 추출 (출력 포맷팅을 별도 노드 없이 여기서 바로 적용)
+            ai_response = self._improve_line_breaks(response.content) if response.content else ""
             
             # 도구 호출 정보 추출 (다양한 방법으로 시도)
             tool_calls = []
             
             # 방법 1: response.tool_calls 확인
             if hasattr(response, 'tool_calls') and response.tool_calls:
-                logger.debug(f"tool_calls 속성 발견: {response.tool_calls}")
-                for tool_call in response.tool_calls:
-                    tool_info = {
-                        "id": getattr(tool_call, 'id', str(tool_call.get('id', 'unknown'))),
-                        "name": getattr(tool_call, 'name', tool_call.get('name', 'unknown')),
-                        "args": getattr(tool_call, 'args', tool_call.get('args', {})),
-                        "type": getattr(tool_call, 'type', tool_call.get('type', 'function'))
-                    }
-                    tool_calls.append(tool_info)
+                logger.opt(lazy=True).debug("tool_calls 속성 발견: {}", lambda: response.tool_calls)
+                tool_calls.extend(self._extract_tool_call(tool_call) for tool_call in response.tool_calls)
             
             # 방법 2: additional_kwargs 확인
             elif hasattr(response, 'additional_kwargs') and response.additional_kwargs:
                 additional_kwargs = response.additional_kwargs
-                logger.debug(f"additional_kwargs 확인: {additional_kwargs}")
+                logger.opt(lazy=True).debug("additional_kwargs 확인: {}", lambda: additional_kwargs)
                 if 'tool_calls' in additional_kwargs:
-                    for tool_call in additional_kwargs['tool_calls']:
-                        tool_info = {
-                            "id": tool_call.get('id', 'unknown'),
-                            "name": tool_call.get('function', {}).get('name', 'unknown'),
-                            "args": tool_call.get('function', {}).get('arguments', {}),
-                            "type": tool_call.get('type', 'function')
-                        }
-                        tool_calls.append(tool_info)
-            
-            # 방법 3: 메시지 히스토리에서 도구 호출 확인
-            if not tool_calls:
-                # 최근 메시지들을 확인하여 도구 호출 찾기
-                for msg in reversed(messages[-5:]):  # 최근 5개 메시지만 확인
-                    if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                        logger.debug(f"메시지 히스토리에서 도구 호출 발견: {msg.tool_calls}")
-                        for tool_call in msg.tool_calls:
-                            tool_info = {
-                                "id": getattr(tool_call, 'id', str(tool_call.get('id', 'unknown'))),
-                                "name": getattr(tool_call, 'name', tool_call.get('name', 'unknown')),
-                                "args": getattr(tool_call, 'args', tool_call.get('args', {})),
-                                "type": getattr(tool_call, 'type', tool_call.get('type', 'function'))
-                            }
-                            tool_calls.append(tool_info)
-                        break
-            
-            # 디버그 로그 추가
-            logger.debug(f"AI 응답 생성: {ai_response[:100]}...")
-            logger.debug(f"도구 호출 정보 추출 결과: {tool_calls}")
-            logger.debug(f"응답 타입: {type(response)}")
-            logger.debug(f"응답 속성: {dir(response)}")
+                    tool_calls.extend(self._extract_tool_call(tool_call) for tool_call in additional_kwargs['tool_calls'])
+            
+            # 방법 3: 도구 실행 직후의 응답이면 메시지 히스토리에서 이번 턴의 도구 호출 확인
+            # (도구 결과 메시지들 바로 앞의 AI 메시지만 확인하므로 복사 없이 뒤에서부터 필요한 만큼만 훑음)
+            if not tool_calls and messages and isinstance(messages[-1], ToolMessage):
+                index = len(messages) - 1
+                while index > 0 and isinstance(messages[index], ToolMessage):
+                    index -= 1
+                requested_tool_calls = getattr(messages[index], 'tool_calls', None)
+                if requested_tool_calls:
+                    logger.opt(lazy=True).debug("메시지 히스토리에서 도구 호출 발견: {}", lambda: requested_tool_calls)
+                    tool_calls.extend(self._extract_tool_call(tool_call) for tool_call in requested_tool_calls)
             
+            # 디버그 로그 추가 (lazy: 디버그 레벨이 꺼져 있으면 메시지 인자를 계산하지 않음)
+            lazy_logger = logger.opt(lazy=True)
+            lazy_logger.debug("AI 응답 생성: {}...", lambda: ai_response[:100])
+            lazy_logger.debug("도구 호출 정보 추출 결과: {}", lambda: tool_calls)
+            lazy_logger.debug("응답 타입: {}", lambda: type(response))
+            lazy_logger.debug("응답 속성: {}", lambda: dir(response))
+            
+            # 응답 메시지만 반환 (add_messages 리듀서가 기존 목록에 추가)
             return {
-                "messages": messages,
+                "messages": [response],
                 "ai_response": ai_response,
-                "tool_calls": tool_calls
+                "tool_calls": tool_calls,
+                "has_tool_calls": bool(getattr(response, "tool_calls", None))
             }
         
         except Exception as e:
@@ -286,55 +491,37 @@ class AgentService:
             error_message = "죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다."
             
             return {
-                "messages": messages + [AIMessage(content=error_message)],
+                "messages": [AIMessage(content=error_message)],
                 "ai_response": error_message,
-                "tool_calls": []
+                "tool_calls": [],
+                "has_tool_calls": False
             }
     
-    def _should_call_tools(self, state: AgentState) -> str:
-        """도구 호출 여부 결정"""
-        messages = state["messages"]
-        
-        # 마지막 메시지가 도구 호출인지 확인
-        if messages:
-            last_message = messages[-1]
-            # AIMessage에서 tool_calls 확인
-            if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-                logger.debug(f"도구 호출 감지: {last_message.tool_calls}")
-                
-                # 도구 호출 정보를 상태에 저장
-                tool_calls = []
-                for tool_call in last_message.tool_calls:
-                    tool_info = {
-                        "id": getattr(tool_call, 'id', str(tool_call.get('id', 'unknown'))),
-                        "name": getattr(tool_call, 'name', tool_call.get('name', 'unknown')),
-                        "args": getattr(tool_call, 'args', tool_call.get('args', {})),
-                        "type": getattr(tool_call, 'type', tool_call.get('type', 'function'))
-                    }
-                    tool_calls.append(tool_info)
-                
-                # 상태 업데이트
-                state["tool_calls"] = tool_calls
-                logger.debug(f"도구 호출 정보 상태에 저장: {tool_calls}")
-                
-                return "call_tools"
-        
-        logger.debug("도구 호출 없음, 출력 포맷팅으로 이동")
-        return "format_output"
-    
-    def _format_output(self, state: AgentState) -> Dict[str, Any]:
-        """출력 포맷팅"""
-        ai_response = state["ai_response"]
-        tool_calls = state.get("tool_calls", [])
-        
-        # 마크다운 텍스트 줄 나눔 개선
-        formatted_response = self._improve_line_breaks(ai_response)
-        
-        logger.debug("응답 포맷팅 완료")
+    @staticmethod
+    def _extract_tool_call(tool_call: Any) -> Dict[str, Any]:
+        """
+        도구 호출 정보를 표준 형식으로 변환
         
+        Args:
+            tool_call: LangChain 도구 호출 또는 OpenAI 원본 형식('function' 키) 딕셔너리, 혹은 속성을 가진 객체
+            
+        Returns:
+            id, name, args, type 키를 가진 딕셔너리
+        """
+        if isinstance(tool_call, dict):
+            # OpenAI 원본 형식은 이름과 인자가 'function' 아래에 있음
+            function = tool_call.get('function') or {}
+            return {
+                "id": str(tool_call.get('id', 'unknown')),
+                "name": tool_call.get('name') or function.get('name', 'unknown'),
+                "args": tool_call.get('args') or function.get('arguments', {}),
+                "type": tool_call.get('type', 'function')
+            }
         return {
-            "ai_response": formatted_response,
-            "tool_calls": tool_calls
+            "id": getattr(tool_call, 'id', 'unknown'),
+            "name": getattr(tool_call, 'name', 'unknown'),
+            "args": getattr(tool_call, 'args', {}),
+            "type": getattr(tool_call, 'type', 'function')
         }
     
     def _improve_line_breaks(self, text: str) -> str:
@@ -342,49 +529,67 @@ class AgentService:
         if not text:
             return text
         
-        # 기본 텍스트 정리
-        text = text.strip()
-        
-        # 마크다운 헤더 앞뒤에 빈 줄 추가
-        import re
-        
-        # ###, ##, # 헤더 앞뒤에 빈 줄 추가
-        text = re.sub(r'([^\n])\n(#{1,6}\s)', r'\1\n\n\2', text)
-        text = re.sub(r'(#{1,6}[^\n]*)\n([^\n#])', r'\1\n\n\2', text)
+        # 헤더, 굵은 텍스트, 연속된 빈 줄이 없으면 바꿀 것이 없으므로 바로 반환 (대부분의 짧은 응답)
+        if '#' not in text and '**' not in text and '\n\n\n' not in text:
+            return text.strip()
         
-        # 목록 항목 (-로 시작하는 줄) 앞에 줄 나눔 추가
-        text = re.sub(r'([^\n])\n(-\s\*\*)', r'\1\n\n\2', text)
-        text = re.sub(r'([^\n])\n(-\s)', r'\1\n\2', text)
+        # 줄 단위로 한 번만 훑으면서 결과 줄 목록을 만든 뒤 마지막에 한 번만 합침
+        lines = text.strip().split('\n')
+        result: List[str] = []
         
-        # **굵은 텍스트** 앞뒤에 적절한 공백 추가 (줄바꿈 보존)
-        # 줄바꿈이 아닌 문자 뒤에 오는 굵은 텍스트 앞에 공백 추가
-        text = re.sub(r'([^\s\n])\s*(\*\*[^*]+\*\*)', r'\1 \2', text)
-        # 굵은 텍스트 뒤에 오는 줄바꿈이 아닌 문자 앞에 공백 추가
-        text = re.sub(r'(\*\*[^*]+\*\*)\s*([^\s\n])', r'\1 \2', text)
-        
-        # **굵은 텍스트** 뒤에 줄바꿈 없이 바로 이어지는 항목들을 분리
-        text = re.sub(r'(\*\*[^*]+\*\*)\s*(\*\*[^*]+\*\*)', r'\1\n\n\2', text)
-        
-        # 연속된 빈 줄을 하나로 통합
-        text = re.sub(r'\n\n\n+', '\n\n', text)
+        for index, line in enumerate(lines):
+            is_header = _is_markdown_header(line)
+            
+            # 헤더와 **굵은** 목록 항목 앞에 빈 줄 추가
+            if result and result[-1] and (is_header or line.startswith('- **')):
+                result.append('')
+            
+            # **굵은 텍스트** 앞뒤 공백 정리 (연속된 빈 줄은 하나로 통합)
+            for processed in _space_bold_text(line):
+                if processed or result[-1:] != ['']:
+                    result.append(processed)
+            
+            # 헤더 뒤에 일반 내용이 바로 이어지면 빈 줄 추가
+            if is_header and index + 1 < len(lines):
+                next_line = lines[index + 1]
+                if next_line and not next_line.startswith('#') and result[-1]:
+                    result.append('')
         
-        return text
+        return '\n'.join(result)
     
-    def _smart_split_for_streaming(self, text: str) -> list:
-        """마크다운 구문을 보호하면서 텍스트를 분할합니다."""
-        import re
-        
-        # 마크다운 구문을 보호하면서 분할
-        # **텍스트**와 같은 패턴은 하나의 토큰으로 유지
-        pattern = r'(\*\*[^*]+\*\*|\*[^*]+\*|`[^`]+`|[^\s]+)'
-        
-        # 패턴에 따라 토큰들을 분할
-        tokens = re.findall(pattern, text)
+    def _smart_split_for_streaming(self, text: str) -> Iterator[str]:
+        """
+        마크다운 구문을 보호하면서 텍스트를 스트리밍 조각으로 분할합니다.
+        각 조각은 뒤따르는 공백/줄바꿈을 포함하므로 조각을 이어 붙이면 원문과 같습니다.
+        """
+        # '*'와 '`'가 없으면 보호할 구문이 없으므로 단순 단어 분할 패턴 사용 (대부분의 응답)
+        pattern = _STREAM_TOKEN_RE if '*' in text or '`' in text else _PLAIN_STREAM_TOKEN_RE
         
-        # 빈 토큰 제거
-        result = [token for token in tokens if token.strip()]
+        # 리스트를 만들지 않고 매칭된 조각을 그대로 전달
+        return (match.group(0) for match in pattern.finditer(text))
+    
+    def _batch_stream_chunks(self, tokens: Iterable[str], size: int = _FALLBACK_CHUNK_CHARS) -> Iterator[str]:
+        """
+        스트리밍 조각을 일정 길이(또는 줄 끝) 단위로 묶어 전달합니다.
         
-        return result
+        Args:
+            tokens: 스트리밍 조각
+            size: 묶음 최소 길이 (문자 수)
+            
+        Yields:
+            묶인 텍스트 조각
+        """
+        buffer: List[str] = []
+        buffered_chars = 0
+        for token in tokens:
+            buffer.append(token)
+            buffered_chars += len(token)
+            if buffered_chars >= size or token.endswith('\n'):
+                yield ''.join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+        if buffer:
+            yield ''.join(buffer)
     
     def _format_tool_display_name(self, tool_name: str) -> str:
         """도구 이름을 사용자에게 친숙하게 표시하기 위해 포맷팅합니다."""
@@ -397,12 +602,8 @@ class AgentService:
         # 언더스코어를 공백으로 변환하고 제목 형식으로 변환
         display_name = display_name.replace("_", " ").title()
         
-        # 일반적인 약어들은 대문자로 유지
-        common_abbreviations = ["Api", "Url", "Id", "Uuid", "Json", "Xml", "Http", "Https"]
-        for abbr in common_abbreviations:
-            display_name = display_name.replace(abbr, abbr.upper())
-        
-        return display_name
+        # 일반적인 약어들은 대문자로 유지 (단어 단위로 한 번에 치환)
+        return _ABBREVIATION_RE.sub(lambda match: match.group(0).upper(), display_name)
 
     def _format_tool_usage_info(self, tool_calls: List[Dict[str, Any]]) -> str:
         """도구 사용 정보를 포맷팅합니다."""
@@ -434,21 +635,33 @@ class AgentService:
         
         return "\n".join(info_parts)
     
+    def _reset_tool_lookup(self) -> None:
+        """도구 이름 조회 테이블과 도구 설명 캐시를 현재 도구 목록 기준으로 초기화"""
+        # 같은 이름이 여러 개면 목록 앞쪽 도구가 우선 (역순으로 채워 앞쪽 값이 남도록 함)
+        self._tools_by_name = {getattr(tool, 'name', None): tool for tool in reversed(self.tools)}
+        self._tool_description_cache: Dict[str, str] = {}
+    
     def _get_tool_description(self, tool_name: str) -> str:
-        """도구 설명을 동적으로 가져옵니다."""
+        """도구 설명을 가져옵니다. (도구 목록이 바뀌기 전까지 캐시)"""
+        description = self._tool_description_cache.get(tool_name)
+        if description is None:
+            description = self._lookup_tool_description(tool_name)
+            self._tool_description_cache[tool_name] = description
+        return description
+    
+    def _lookup_tool_description(self, tool_name: str) -> str:
+        """도구 설명을 동적으로 찾습니다."""
         # 1. 기본 도구 레지스트리에서 도구 정보 가져오기
-        for tool in self.tools:
-            if getattr(tool, 'name', None) == tool_name:
-                # LangChain 도구의 description 속성 사용
-                description = getattr(tool, 'description', None)
-                if description:
-                    return description
-                
-                # func 속성의 __doc__ 사용
-                if hasattr(tool, 'func') and hasattr(tool.func, '__doc__') and tool.func.__doc__:
-                    return tool.func.__doc__.strip()
-                
-                break
+        tool = self._tools_by_name.get(tool_name)
+        if tool is not None:
+            # LangChain 도구의 description 속성 사용
+            description = getattr(tool, 'description', None)
+            if description:
+                return description
+            
+            # func 속성의 __doc__ 사용
+            if hasattr(tool, 'func') and hasattr(tool.func, '__doc__') and tool.func.__doc__:
+                return tool.func.__doc__.strip()
         
         # 2. MCP 도구의 경우 MCP 클라이언트에서 도구 정보 가져오기
         try:
@@ -479,16 +692,28 @@ class AgentService:
         if not args:
             return "없음"
         
-        param_parts = []
-        for key, value in args.items():
-            if isinstance(value, str) and len(value) > 50:
-                # 긴 문자열은 잘라서 표시
-                param_parts.append(f"{key}=\"{value[:50]}...\"")
-            else:
-                param_parts.append(f"{key}={value}")
-        
-        return ", ".join(param_parts)
+        # 긴 문자열은 잘라서 표시 (중간 리스트 없이 바로 합침)
+        return ", ".join(
+            f"{key}=\"{value[:50]}...\"" if isinstance(value, str) and len(value) > 50 else f"{key}={value}"
+            for key, value in args.items()
+        )
 
+    def _build_initial_state(self, user_input: str, conversation_state: Optional[Dict]) -> Dict[str, Any]:
+        """
+        워크플로우 실행용 초기 상태 생성 (고정 기본값 템플릿을 복사해 사용)
+        
+        Args:
+            user_input: 사용자 입력
+            conversation_state: 대화 상태 (선택사항)
+            
+        Returns:
+            초기 상태 딕셔너리
+        """
+        initial_state = _INITIAL_STATE_TEMPLATE.copy()
+        initial_state["messages"] = conversation_state.get("messages", []) if conversation_state else []
+        initial_state["user_input"] = user_input
+        return initial_state
+    
     async def chat(self, user_input: str, conversation_state: Optional[Dict] = None) -> Tuple[str, List[Dict[str, Any]]]:
         """
         사용자 입력에 대한 AI 에이전트 응답 생성
@@ -502,13 +727,7 @@ class AgentService:
         """
         try:
             # 초기 상태 설정
-            initial_state = {
-                "messages": conversation_state.get("messages", []) if conversation_state else [],
-                "user_input": user_input,
-                "system_prompt": self.system_prompt,
-                "ai_response": "",
-                "tool_calls": []
-            }
+            initial_state = self._build_initial_state(user_input, conversation_state)
             
             # 워크플로우 실행
             result = await self.app.ainvoke(initial_state)
@@ -521,7 +740,36 @@ class AgentService:
             
         except Exception as e:
             logger.error(f"채팅 처리 실패: {e}")
-            return "죄송합니다. 요청을 처리하는 중에 오류가 발생했습니다.", []
+            return _REQUEST_ERROR_MESSAGE, []
+    
+    async def chat_batch(self, user_inputs: List[str], max_concurrency: int = 10) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        서로 독립적인 여러 사용자 입력을 동시에 처리 (각 입력은 새 대화로 처리)
+        
+        Args:
+            user_inputs: 사용자 입력 목록
+            max_concurrency: 동시에 실행할 최대 워크플로우 수
+            
+        Returns:
+            입력 순서대로 (AI 응답, 도구 호출 정보) 튜플 목록
+        """
+        initial_states = [self._build_initial_state(user_input, None) for user_input in user_inputs]
+        
+        # 한 입력의 실패가 나머지 결과를 막지 않도록 예외를 결과로 받음
+        results = await self.app.abatch(
+            initial_states,
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+        
+        responses = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"채팅 처리 실패: {result}")
+                responses.append((_REQUEST_ERROR_MESSAGE, []))
+            else:
+                responses.append((result["ai_response"], result.get("tool_calls", [])))
+        return responses
     
     async def chat_stream_with_workflow(self, user_input: str, conversation_state: Optional[Dict] = None, debug_mode: bool = False):
         """
@@ -537,97 +785,84 @@ class AgentService:
         """
         try:
             # 초기 상태 설정
-            initial_state = {
-                "messages": conversation_state.get("messages", []) if conversation_state else [],
-                "user_input": user_input,
-                "system_prompt": self.system_prompt,
-                "ai_response": "",
-                "tool_calls": []
-            }
+            initial_state = self._build_initial_state(user_input, conversation_state)
             
             # 상태 추적 변수
-            tools_displayed = False
             final_response_started = False
+            tokens_streamed = False
+            formatted_response = ""
+            final_state = None
             
             # 워크플로우 스트리밍 실행
-            async for chunk in self.app.astream(initial_state):
+            # - "messages": generate_response 노드의 LLM 토큰을 도착하는 즉시 전달
+            # - "updates": 노드 단위 상태 변경 (도구 호출/워크플로우 단계 표시용)
+            # - "values": 단계별 전체 상태 (대화 상태 업데이트용)
+            async for stream_mode, payload in self.app.astream(initial_state, stream_mode=["messages", "updates", "values"]):
+                if stream_mode == "values":
+                    final_state = payload
+                    continue
+                
+                if stream_mode == "messages":
+                    message_chunk, metadata = payload
+                    if metadata.get("langgraph_node") != "generate_response" or not isinstance(message_chunk, AIMessageChunk):
+                        continue
+                    token = message_chunk.content
+                    if token and isinstance(token, str):
+                        tokens_streamed = True
+                        yield {"type": "text", "data": token}
+                    continue
+                
                 # 각 노드 실행 상태 확인
-                for node_name, node_state in chunk.items():
+                for node_name, node_state in payload.items():
                     if node_name == "generate_response":
                         # AI 응답 생성 시작
                         if debug_mode:
                             yield {"type": "workflow_step", "data": {"step": "generate_response", "status": "started"}}
                         
-                        # 도구 호출 정보 확인 (첫 번째 generate_response에서만)
+                        # 도구 호출이 결정된 경우 call_tools 노드가 실행되기 전에 바로 알림 (도구 호출 라운드마다)
                         tool_calls = node_state.get("tool_calls", [])
-                        if tool_calls and not tools_displayed:
+                        if node_state.get("has_tool_calls") and tool_calls:
                             # 도구 호출 예정 알림
                             yield {"type": "tools_pending", "data": {"tool_calls": tool_calls, "debug_mode": debug_mode}}
-                            tools_displayed = True
+                            
+                            # 도구 실행 시작 (ToolNode가 여러 도구 호출을 병렬로 실행)
+                            if debug_mode:
+                                yield {"type": "workflow_step", "data": {"step": "call_tools", "status": "started"}}
+                            for tool_call in tool_calls:
+                                yield {"type": "tool_executing", "data": {"tool_name": tool_call.get("name", "unknown")}}
                         
-                        # AI 응답이 시작된 경우 (도구 호출 후 두 번째 generate_response)
+                        # AI 응답이 시작된 경우 (토큰 스트리밍 없이 응답이 완성된 경우에만 알림)
                         ai_response = node_state.get("ai_response", "")
-                        if ai_response and not final_response_started:
+                        if ai_response and not final_response_started and not tokens_streamed:
                             final_response_started = True
                             yield {"type": "ai_response_ready", "data": {"response": ai_response}}
+                        
+                        # 최종 응답 (generate_response 노드에서 이미 포맷팅됨, 마지막 실행 결과가 최종 응답)
+                        formatted_response = ai_response
                     
                     elif node_name == "call_tools":
-                        # 도구 실행 시작
-                        if debug_mode:
-                            yield {"type": "workflow_step", "data": {"step": "call_tools", "status": "started"}}
-                        
-                        # 메시지에서 도구 호출 정보 추출
-                        messages = node_state.get("messages", [])
-                        if messages:
-                            # 도구 호출 메시지 찾기
-                            for msg in reversed(messages):
-                                if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                                    # 개별 도구 실행 상태 표시
-                                    for tool_call in msg.tool_calls:
-                                        tool_name = getattr(tool_call, 'name', tool_call.get('name', 'unknown'))
-                                        yield {"type": "tool_executing", "data": {"tool_name": tool_name}}
-                                    break
-                        
-                        # 도구 실행 완료
+                        # 도구 실행 완료 (이후 generate_response의 토큰이 바로 스트리밍됨)
                         if debug_mode:
                             yield {"type": "workflow_step", "data": {"step": "call_tools", "status": "completed"}}
-                    
-                    elif node_name == "format_output":
-                        # 출력 포맷팅
-                        if debug_mode:
-                            yield {"type": "workflow_step", "data": {"step": "format_output", "status": "started"}}
-                        
-                        # 최종 응답 포맷팅 및 스트리밍
-                        ai_response = node_state.get("ai_response", "")
-                        if ai_response:
-                            # 대화 상태 업데이트
-                            if conversation_state is not None:
-                                conversation_state["messages"] = node_state.get("messages", [])
-                            
-                            # 포맷팅된 응답 스트리밍
-                            formatted_response = self._improve_line_breaks(ai_response)
-                            lines = formatted_response.split('\n')
-                            
-                            for line_idx, line in enumerate(lines):
-                                if line.strip():
-                                    tokens = self._smart_split_for_streaming(line)
-                                    for token_idx, token in enumerate(tokens):
-                                        if token_idx == 0:
-                                            yield {"type": "text", "data": token}
-                                        else:
-                                            yield {"type": "text", "data": " " + token}
-                                if line_idx < len(lines) - 1:
-                                    yield {"type": "text", "data": "\n"}
-                            
-                            # 스트리밍 완료
-                            yield {"type": "streaming_complete", "data": {"final_response": formatted_response}}
-                            return
+            
+            # 대화 상태 업데이트 (마지막 전체 상태의 메시지 사용)
+            if conversation_state is not None and final_state is not None:
+                conversation_state["messages"] = final_state.get("messages", [])
+            
+            if formatted_response:
+                # LLM이 토큰 스트리밍을 하지 않은 경우에만 완성된 응답을 나눠서 전달
+                if not tokens_streamed:
+                    for chunk in self._batch_stream_chunks(self._smart_split_for_streaming(formatted_response)):
+                        yield {"type": "text", "data": chunk}
+                
+                # 스트리밍 완료
+                yield {"type": "streaming_complete", "data": {"final_response": formatted_response}}
             
             logger.debug("워크플로우 스트리밍 완료")
             
         except Exception as e:
             logger.error(f"워크플로우 스트리밍 실패: {e}")
-            yield {"type": "error", "data": "죄송합니다. 요청을 처리하는 중에 오류가 발생했습니다."}
+            yield {"type": "error", "data": _REQUEST_ERROR_MESSAGE}
 
     async def chat_stream(self, user_input: str, conversation_state: Optional[Dict] = None, debug_mode: bool = False):
         """
@@ -645,6 +880,12 @@ class AgentService:
         async for chunk in self.chat_stream_with_workflow(user_input, conversation_state, debug_mode):
             yield chunk
 
+    def get_graph(self):
+        """컴파일된 워크플로우의 그래프 구조 반환 (워크플로우가 재컴파일되기 전까지 캐시)"""
+        if self._graph_cache is None or self._graph_cache[0] is not self.app:
+            self._graph_cache = (self.app, self.app.get_graph())
+        return self._graph_cache[1]
+
     def get_tool_usage_info(self, tool_calls: List[Dict[str, Any]]) -> str:
         """도구 사용 정보를 포맷팅된 문자열로 반환합니다."""
         return self._format_tool_usage_info(tool_calls)
@@ -679,4 +920,54 @@ def create_agent_service(openai_config: Dict[str, Any], agent_config: Dict[str,
     Returns:
         AgentService 인스턴스
     """
-    return AgentService(openai_config, agent_config, mcp_servers) 
\ No newline at end of file
+    return AgentService(openai_config, agent_config, mcp_servers)
+
+
+# 설정별 에이전트 서비스 캐시 (같은 프로세스 안에서 LLM 클라이언트/그래프 컴파일 재사용)
+# 설정 조합이 바뀔 때마다 항목이 늘어나지 않도록 최근 사용 순으로 최대 개수만 유지
+_AGENT_SERVICE_CACHE_SIZE = 4
+_agent_service_cache: OrderedDict[tuple, AgentService] = OrderedDict()
+
+
+def _freeze(value: Any) -> Any:
+    """중첩된 dict/list 설정 값을 캐시 키로 쓸 수 있는 튜플로 변환 (dict는 키 순서와 무관)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _make_service_cache_key(openai_config: Dict[str, Any], agent_config: Dict[str, Any], mcp_servers: List[Dict[str, Any]] = None) -> tuple:
+    """서비스 캐시 키 생성 (MCP 서버는 헤더/타임아웃 등 전체 설정을 키에 포함)"""
+    return (_freeze(dict(openai_config)), _freeze(dict(agent_config)), _freeze(list(mcp_servers or [])))
+
+
+def get_agent_service(openai_config: Dict[str, Any], agent_config: Dict[str, Any], mcp_servers: List[Dict[str, Any]] = None) -> AgentService:
+    """
+    동일한 설정에 대해 캐시된 AI 에이전트 서비스 인스턴스를 반환
+    
+    Args:
+        openai_config: OpenAI API 설정
+        agent_config: 에이전트 설정
+        mcp_servers: MCP 서버 설정 목록
+        
+    Returns:
+        AgentService 인스턴스 (캐시된 인스턴스가 없으면 새로 생성)
+    """
+    try:
+        cache_key = _make_service_cache_key(openai_config, agent_config, mcp_servers)
+        agent_service = _agent_service_cache.get(cache_key)
+    except TypeError:
+        # 해시할 수 없는 설정 값이 있으면 캐시 없이 생성
+        return create_agent_service(openai_config, agent_config, mcp_servers)
+    
+    if agent_service is not None:
+        _agent_service_cache.move_to_end(cache_key)
+        return agent_service
+    
+    agent_service = create_agent_service(openai_config, agent_config, mcp_servers)
+    _agent_service_cache[cache_key] = agent_service
+    if len(_agent_service_cache) > _AGENT_SERVICE_CACHE_SIZE:
+        _agent_service_cache.popitem(last=False)
+    return agent_service
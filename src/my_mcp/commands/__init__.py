@@ -1,15 +1,33 @@
 """
 Commands 패키지 - CLI 명령어들의 비즈니스 로직
+
+각 명령어 모듈은 필요한 시점에 지연 import 됩니다.
+(chat/export는 LangGraph·LangChain을 끌어오므로 version/setup 같은 가벼운 명령어의 시작 시간을 줄이기 위함)
 """
 
-from .chat import ChatCommand
-from .info import InfoCommand
-from .setup import SetupCommand
-from .export import ExportCommand
+import importlib
+
+_COMMAND_MODULES = {
+    "ChatCommand": ".chat",
+    "InfoCommand": ".info",
+    "SetupCommand": ".setup",
+    "ExportCommand": ".export",
+}
 
 __all__ = [
     "ChatCommand",
     "InfoCommand", 
     "SetupCommand",
     "ExportCommand"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """명령어 클래스를 처음 접근할 때 해당 모듈을 import 합니다."""
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    command_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = command_class
+    return command_class
@@ -4,18 +4,35 @@
 
 import asyncio
 import sys
+import time
 from typing import Dict, Optional
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
-from ..agent.service import create_agent_service
-from ..utils.markdown_utils import save_conversation_to_markdown
+from ..agent.service import get_agent_service
+from ..utils.markdown_utils import ConversationMarkdownWriter
+from ..utils.progress_utils import spinner_progress
 from ..logging import get_logger
 
 console = Console()
 logger = get_logger("my_mcp.commands.chat")
 
+# 스트리밍 텍스트 flush 주기 (초)
+STREAM_FLUSH_INTERVAL = 0.03
+# flush 주기 전이라도 이만큼 쌓이면 바로 flush 할 문자 수
+STREAM_FLUSH_CHARS = 64
+
+# 사용자 입력 프롬프트 (매 턴 마크업을 다시 파싱하지 않도록 미리 생성)
+USER_PROMPT = Text.from_markup("[bold green]🧑 You:[/bold green] ")
+# AI 응답 패널 제목 (Panel이 렌더링할 때 복사해서 쓰므로 공유해도 안전)
+AI_PANEL_TITLE = Text("🤖 AI")
+
+# 연속 대화 종료 명령어 (대소문자 무시)
+EXIT_COMMANDS = frozenset(("/bye", "/quit", "/exit"))
+# 이보다 긴 입력은 종료 명령어일 수 없으므로 소문자 변환 없이 바로 넘어감
+_MAX_EXIT_COMMAND_LEN = max(map(len, EXIT_COMMANDS))
+
 
 class ChatCommand:
     """채팅 명령어 처리 클래스"""
@@ -33,8 +50,10 @@ class ChatCommand:
         self.chatbot_config = chatbot_config
         self.mcp_servers = mcp_servers or []
         self.agent_service = None
+        # 파이프 입력이면 stdin을 한 번만 확인하고 줄 단위 iterator를 재사용 (매 턴 isatty 호출 방지)
+        self._stdin_lines = None if sys.stdin.isatty() else iter(sys.stdin)
     
-    def _get_user_input(self, prompt: str) -> str:
+    def _get_user_input(self, prompt: Text) -> str:
         """
         사용자 입력을 받는 함수
         파이프 입력인 경우 프롬프트를 표시하지 않지만 입력 내용은 표시함
@@ -45,31 +64,35 @@ class ChatCommand:
         Returns:
             사용자 입력 문자열
         """
-        if sys.stdin.isatty():
+        if self._stdin_lines is None:
             # 터미널에서 직접 입력받는 경우
             return console.input(prompt)
         else:
             # 파이프 입력인 경우
-            line = sys.stdin.readline()
-            if not line:
+            line = next(self._stdin_lines, None)
+            if line is None:
                 raise EOFError()
             user_input = line.rstrip('\n\r')
-            # 파이프 입력 내용을 화면에 표시 (일관성을 위해 항상 "You:" 사용)
-            console.print(f"[bold green]🧑 You:[/bold green] {user_input}")
+            # 파이프 입력 내용을 화면에 표시 (일관성을 위해 항상 "You:" 사용, 입력 내용은 마크업으로 해석하지 않음)
+            console.print(Text.assemble(prompt, user_input))
             return user_input
     
-    async def _initialize_agent(self):
-        """에이전트 서비스 초기화"""
+    async def _initialize_agent(self, warm_up: bool = False):
+        """
+        에이전트 서비스 초기화
+        
+        Args:
+            warm_up: 스피너가 도는 동안 OpenAI API 연결을 미리 수립할지 여부
+        """
         if self.agent_service is None:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True
-            ) as progress:
+            with spinner_progress() as progress:
                 task = progress.add_task("에이전트 초기화 중...", total=None)
-                self.agent_service = create_agent_service(self.openai_config, self.chatbot_config, self.mcp_servers)
+                self.agent_service = get_agent_service(self.openai_config, self.chatbot_config, self.mcp_servers)
                 progress.update(task, completed=100)
                 
+                # OpenAI API 연결 준비 (MCP 서버 연결과 동시에 진행)
+                warm_up_task = asyncio.create_task(self.agent_service.warm_up_connection()) if warm_up else None
+                
                 # MCP 서버 연결 시도
                 if self.mcp_servers:
                     connection_task = progress.add_task("MCP 서버 연결 중...", total=None)
@@ -79,6 +102,9 @@ class ChatCommand:
                     # 연결 결과 로그
                     connected_count = sum(1 for success in connection_results.values() if success)
                     logger.info(f"MCP 서버 연결 완료: {connected_count}/{len(self.mcp_servers)}개 성공")
+                
+                if warm_up_task is not None:
+                    await warm_up_task
     
     async def execute_once(self, question: str = None, no_stream: bool = False, save: str = None, debug: bool = False):
         """
@@ -92,9 +118,6 @@ class ChatCommand:
         """
         await self._initialize_agent()
         
-        # 마크다운 저장을 위한 대화 기록
-        conversation_log = []
-        
         # 간단한 환영 메시지 (일회성)
         console.print(f"[bold blue]🤖 {self.agent_service.get_agent_name()}[/bold blue]")
         console.print("[dim]일회성 대화 모드입니다.[/dim]")
@@ -108,7 +131,7 @@ class ChatCommand:
         else:
             # 사용자 입력 받기
             try:
-                user_input = self._get_user_input("[bold green]🧑 You:[/bold green] ")
+                user_input = self._get_user_input(USER_PROMPT)
             except EOFError:
                 logger.debug("EOF 발생으로 일회성 대화 모드 종료")
                 return
@@ -131,9 +154,8 @@ class ChatCommand:
         
         # 마크다운 저장 (일회성)
         if save:
-            conversation_log.append(f"**사용자**: {user_input}\n")
-            conversation_log.append(f"**AI**: {ai_response}\n")
-            save_conversation_to_markdown(conversation_log, save)
+            with ConversationMarkdownWriter(save) as conversation_writer:
+                conversation_writer.write_turn(user_input, ai_response)
     
     async def execute_continuous(self, no_stream: bool = False, save: str = None, debug: bool = False):
         """
@@ -144,10 +166,7 @@ class ChatCommand:
             save: 저장할 파일명
             debug: 디버그 모드 활성화
         """
-        await self._initialize_agent()
-        
-        # 마크다운 저장을 위한 대화 기록
-        conversation_log = []
+        await self._initialize_agent(warm_up=True)
         
         # 환영 메시지 표시
         welcome_panel = Panel(
@@ -166,47 +185,52 @@ class ChatCommand:
         # 대화 상태 저장
         conversation_state = {"messages": []}
         
-        # 대화 루프
-        while True:
-            try:
-                # 사용자 입력 받기
-                user_input = self._get_user_input("[bold green]🧑 You:[/bold green] ")
-                
-                # 종료 명령어 확인
-                if user_input.strip().lower() == "/bye":
-                    console.print("[yellow]대화를 종료합니다. 안녕히 가세요! 👋[/yellow]")
+        # 스트리밍 모드 확인 (옵션으로 재정의, 대화 루프 밖에서 한 번만 계산)
+        streaming_enabled = self.openai_config.get("streaming", True) and not no_stream
+        
+        # 마크다운 저장을 위한 대화 기록 파일 (대화마다 바로 기록)
+        conversation_writer = ConversationMarkdownWriter(save) if save else None
+        
+        try:
+            # 대화 루프
+            while True:
+                try:
+                    # 사용자 입력 받기
+                    user_input = self._get_user_input(USER_PROMPT)
+                    
+                    stripped_input = user_input.strip()
+                    
+                    # 빈 입력 무시
+                    if not stripped_input:
+                        continue
+                    
+                    # 종료 명령어 확인 (긴 입력은 소문자 변환 없이 건너뜀)
+                    if len(stripped_input) <= _MAX_EXIT_COMMAND_LEN and stripped_input.lower() in EXIT_COMMANDS:
+                        console.print("[yellow]대화를 종료합니다. 안녕히 가세요! 👋[/yellow]")
+                        break
+                    
+                    ai_response = await self._process_message(user_input, conversation_state, streaming_enabled, debug)
+                    
+                    # 마크다운 저장 (대화마다 파일에 바로 기록)
+                    if conversation_writer:
+                        conversation_writer.write_turn(user_input, ai_response)
+                    
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]대화를 종료합니다. 안녕히 가세요! 👋[/yellow]")
                     break
-                
-                # 빈 입력 무시
-                if not user_input.strip():
+                except EOFError:
+                    # EOF 발생 시 조용히 종료
+                    logger.debug("EOF 발생 - 연속 대화 모드 종료")
+                    break
+                except Exception as e:
+                    console.print(f"[red]오류가 발생했습니다: {e}[/red]")
+                    logger.error(f"채팅 오류: {e}")
+                    # 연속적인 오류 방지를 위해 잠시 대기 후 계속
                     continue
-                
-                # 스트리밍 모드 확인 (옵션으로 재정의)
-                streaming_enabled = self.openai_config.get("streaming", True) and not no_stream
-                
-                ai_response = await self._process_message(user_input, conversation_state, streaming_enabled, debug)
-                
-                # 마크다운 저장을 위한 대화 기록
-                if save:
-                    conversation_log.append(f"**사용자**: {user_input}\n")
-                    conversation_log.append(f"**AI**: {ai_response}\n")
-                
-            except KeyboardInterrupt:
-                console.print("\n[yellow]대화를 종료합니다. 안녕히 가세요! 👋[/yellow]")
-                break
-            except EOFError:
-                # EOF 발생 시 조용히 종료
-                logger.debug("EOF 발생 - 연속 대화 모드 종료")
-                break
-            except Exception as e:
-                console.print(f"[red]오류가 발생했습니다: {e}[/red]")
-                logger.error(f"채팅 오류: {e}")
-                # 연속적인 오류 방지를 위해 잠시 대기 후 계속
-                continue
-        
-        # 연속 대화 모드 종료 시 마크다운 저장
-        if save and conversation_log:
-            save_conversation_to_markdown(conversation_log, save)
+        finally:
+            # 연속 대화 모드 종료 시 저장 파일 닫기
+            if conversation_writer:
+                conversation_writer.close()
     
     async def _process_message(self, user_input: str, conversation_state: Dict, streaming_enabled: bool, debug_mode: bool = False) -> str:
         """
@@ -218,101 +242,144 @@ class ChatCommand:
             streaming_enabled: 스트리밍 활성화 여부
             debug_mode: 디버그 모드 (모델 ID 표시 여부)
             
+        Returns:
+            AI 응답
+        """
+        if streaming_enabled:
+            return await self._process_message_stream(user_input, conversation_state, debug_mode)
+        return await self._process_message_blocking(user_input, conversation_state, debug_mode)
+    
+    async def _process_message_stream(self, user_input: str, conversation_state: Dict, debug_mode: bool = False) -> str:
+        """
+        스트리밍 모드 메시지 처리
+        
+        Args:
+            user_input: 사용자 입력
+            conversation_state: 대화 상태
+            debug_mode: 디버그 모드 (모델 ID 표시 여부)
+            
         Returns:
             AI 응답
         """
         ai_response = ""
         
-        if streaming_enabled:
-            # AI 응답 스트리밍 생성
-            try:
-                response_started = False
-                current_tools = []
+        # AI 응답 스트리밍 생성
+        try:
+            response_started = False
+            current_tools = []
+            
+            # 텍스트 청크는 Rich 마크업 파싱 없이 stdout에 직접 쓰고 일정 주기/일정 크기마다 flush
+            stdout_write = sys.stdout.write
+            stdout_flush = sys.stdout.flush
+            last_flush = time.monotonic()
+            pending_chars = 0
+            
+            # 응답 텍스트는 리스트에 모았다가 마지막에 한 번만 합침
+            response_parts = []
+            
+            async for chunk in self.agent_service.chat_stream(user_input, conversation_state, debug_mode):
+                chunk_type = chunk.get("type", "text")
+                chunk_data = chunk.get("data", "")
+                
+                if chunk_type == "workflow_step":
+                    # 워크플로우 단계 표시 (디버그 모드에서만)
+                    if debug_mode:
+                        step = chunk_data.get("step", "")
+                        status = chunk_data.get("status", "")
+                        console.print(f"[dim]🔧 워크플로우: {step} - {status}[/dim]")
+                
+                elif chunk_type == "tools_pending":
+                    # 도구 호출 예정 알림
+                    tool_calls = chunk_data.get("tool_calls", [])
+                    debug_mode_flag = chunk_data.get("debug_mode", False)
+                    if tool_calls:
+                        self._display_tools_pending(tool_calls, debug_mode_flag)
+                        current_tools = tool_calls
                 
-                async for chunk in self.agent_service.chat_stream(user_input, conversation_state, debug_mode):
-                    chunk_type = chunk.get("type", "text")
-                    chunk_data = chunk.get("data", "")
+                elif chunk_type == "tool_executing":
+                    # 개별 도구 실행 중 상태 표시
+                    tool_name = chunk_data.get("tool_name", "unknown")
+                    self._display_tool_executing(tool_name, current_tools, debug_mode)
+                
+                elif chunk_type == "ai_response_ready":
+                    # AI 응답 준비 완료 (도구 실행 후)
+                    logger.debug("✅ 도구 실행 완료")
+                    console.print("🤖 AI: ", end="", style="bold cyan")
+                    response_started = True
+                
+                elif chunk_type == "text":
+                    # 텍스트 청크 처리
+                    if not response_started:
+                        # 도구 호출 없이 직접 응답하는 경우
+                        console.print("🤖 AI: ", end="", style="bold cyan")
+                        response_started = True
                     
-                    if chunk_type == "workflow_step":
-                        # 워크플로우 단계 표시 (디버그 모드에서만)
-                        if debug_mode:
-                            step = chunk_data.get("step", "")
-                            status = chunk_data.get("status", "")
-                            console.print(f"[dim]🔧 워크플로우: {step} - {status}[/dim]")
+                    stdout_write(chunk_data)
+                    response_parts.append(chunk_data)
+                    pending_chars += len(chunk_data)
                     
-                    elif chunk_type == "tools_pending":
-                        # 도구 호출 예정 알림
-                        tool_calls = chunk_data.get("tool_calls", [])
-                        debug_mode_flag = chunk_data.get("debug_mode", False)
-                        if tool_calls:
-                            self._display_tools_pending(tool_calls, debug_mode_flag)
-                            current_tools = tool_calls
+                    now = time.monotonic()
+                    if pending_chars >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                        stdout_flush()
+                        last_flush = now
+                        pending_chars = 0
                     
-                    elif chunk_type == "tool_executing":
-                        # 개별 도구 실행 중 상태 표시
-                        tool_name = chunk_data.get("tool_name", "unknown")
-                        self._display_tool_executing(tool_name, current_tools, debug_mode)
+                elif chunk_type == "streaming_complete":
+                    # 스트리밍 완료
+                    final_response = chunk_data.get("final_response", "")
+                    if final_response and not response_parts:
+                        response_parts.append(final_response)
+                    break
                     
-                    elif chunk_type == "ai_response_ready":
-                        # AI 응답 준비 완료 (도구 실행 후)
-                        logger.debug("✅ 도구 실행 완료")
-                        console.print("🤖 AI: ", end="", style="bold cyan")
-                        response_started = True
+                elif chunk_type == "error":
+                    console.print(f"\n[red]스트리밍 오류: {chunk_data}[/red]")
+                    response_parts = [chunk_data]
+                    break
+            
+            ai_response = "".join(response_parts)
                     
-                    elif chunk_type == "text":
-                        # 텍스트 청크 처리
-                        if not response_started:
-                            # 도구 호출 없이 직접 응답하는 경우
-                            console.print("🤖 AI: ", end="", style="bold cyan")
-                            response_started = True
-                        
-                        console.print(chunk_data, end="", style="white")
-                        ai_response += chunk_data
-                        
-                    elif chunk_type == "streaming_complete":
-                        # 스트리밍 완료
-                        final_response = chunk_data.get("final_response", "")
-                        if final_response and not ai_response:
-                            ai_response = final_response
-                        break
-                        
-                    elif chunk_type == "error":
-                        console.print(f"\n[red]스트리밍 오류: {chunk_data}[/red]")
-                        ai_response = chunk_data
-                        break
-                        
-                # 스트리밍 완료 후 줄 나눔 추가
-                console.print("\n")
-                
-            except Exception as e:
-                console.print(f"\n[red]스트리밍 오류: {e}[/red]")
-                logger.error(f"스트리밍 오류: {e}")
-                ai_response = "죄송합니다. 요청을 처리하는 중에 오류가 발생했습니다."
-        else:
-            # 기존 방식 (전체 응답 한 번에)
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True
-            ) as progress:
-                task = progress.add_task("AI가 답변을 생성하는 중...", total=None)
-                
-                # 비동기 호출 (수정된 반환 타입 처리)
-                ai_response, tool_calls = await self.agent_service.chat(user_input, conversation_state)
-                progress.update(task, completed=100)
+            # 남은 출력 flush 후 줄 나눔 추가
+            stdout_flush()
+            console.print("\n")
             
-            # 도구 사용 정보 표시
-            if tool_calls:
-                self._display_tool_usage_info(tool_calls, debug_mode)
+        except Exception as e:
+            console.print(f"\n[red]스트리밍 오류: {e}[/red]")
+            logger.error(f"스트리밍 오류: {e}")
+            ai_response = "죄송합니다. 요청을 처리하는 중에 오류가 발생했습니다."
+        
+        return ai_response
+    
+    async def _process_message_blocking(self, user_input: str, conversation_state: Dict, debug_mode: bool = False) -> str:
+        """
+        일반 모드 메시지 처리 (전체 응답 한 번에)
+        
+        Args:
+            user_input: 사용자 입력
+            conversation_state: 대화 상태
+            debug_mode: 디버그 모드 (모델 ID 표시 여부)
+            
+        Returns:
+            AI 응답
+        """
+        with spinner_progress() as progress:
+            task = progress.add_task("AI가 답변을 생성하는 중...", total=None)
             
-            # AI 응답 표시
-            ai_panel = Panel(
-                ai_response,
-                title="🤖 AI",
-                border_style="cyan"
-            )
-            console.print(ai_panel)
-            console.print()
+            # 비동기 호출 (수정된 반환 타입 처리)
+            ai_response, tool_calls = await self.agent_service.chat(user_input, conversation_state)
+            progress.update(task, completed=100)
+        
+        # 도구 사용 정보 표시
+        if tool_calls:
+            self._display_tool_usage_info(tool_calls, debug_mode)
+        
+        # AI 응답 표시 (모델 출력은 Rich 마크업/하이라이트 없이 그대로 표시)
+        ai_panel = Panel(
+            Text(ai_response),
+            title=AI_PANEL_TITLE,
+            border_style="cyan"
+        )
+        console.print(ai_panel)
+        console.print()
         
         return ai_response
     
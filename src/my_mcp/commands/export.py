@@ -2,13 +2,13 @@
 그래프 내보내기 명령어 비즈니스 로직
 """
 
-import json
 from pathlib import Path
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..agent.service import create_agent_service
+from ..agent.service import get_agent_service
 from ..utils.diagram_utils import generate_ai_description_sync, generate_mermaid_diagram
+from ..utils.progress_utils import spinner_progress
+from ..utils.output_utils import to_json_bytes
 from ..logging import get_logger
 
 console = Console()
@@ -54,13 +54,9 @@ class ExportCommand:
         
         try:
             # 챗봇 서비스 생성
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True
-            ) as progress:
+            with spinner_progress() as progress:
                 task = progress.add_task("에이전트 서비스 초기화 중...", total=None)
-                agent_service = create_agent_service(self.openai_config, self.chatbot_config, self.mcp_servers)
+                agent_service = get_agent_service(self.openai_config, self.chatbot_config, self.mcp_servers)
                 
                 # MCP 서버 연결 (비동기)
                 import asyncio
@@ -79,11 +75,7 @@ class ExportCommand:
             # AI 설명 생성
             description = None
             if ai_description:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    transient=True
-                ) as progress:
+                with spinner_progress() as progress:
                     task = progress.add_task("AI가 그래프 구조 설명을 생성하는 중...", total=None)
                     description = generate_ai_description_sync(agent_service, nodes, edges, tools)
                     progress.update(task, completed=100)
@@ -112,46 +104,14 @@ class ExportCommand:
             agent_service: 에이전트 서비스
             
         Returns:
-            tuple: (nodes, edges, tools)
+            tuple: (nodes, edges, tools) - edges는 (source, target) 튜플 리스트
         """
-        graph = agent_service.app.get_graph()
-        
         try:
-            # 그래프에서 실제 노드와 엣지 정보 추출
-            nodes = []
-            edges = []
-            
-            # 그래프가 dict 형태인지 확인
-            if hasattr(graph, 'nodes') and hasattr(graph, 'edges'):
-                # 노드 정보 추출
-                if hasattr(graph.nodes, '__call__'):
-                    nodes = list(graph.nodes())
-                elif hasattr(graph.nodes, 'keys'):
-                    nodes = list(graph.nodes.keys())
-                else:
-                    nodes = list(graph.nodes) if graph.nodes else []
-                
-                # 엣지 정보 추출
-                if hasattr(graph.edges, '__call__'):
-                    raw_edges = list(graph.edges())
-                    # Edge 객체에서 source와 target 추출
-                    edges = []
-                    for edge in raw_edges:
-                        if hasattr(edge, 'source') and hasattr(edge, 'target'):
-                            edges.append((edge.source, edge.target))
-                        elif isinstance(edge, (list, tuple)) and len(edge) >= 2:
-                            edges.append((edge[0], edge[1]))
-                elif hasattr(graph.edges, 'keys'):
-                    edges = [(k, v) for k, v in graph.edges.items()]
-                else:
-                    edges = list(graph.edges) if graph.edges else []
-            
-            # 추출 실패 시 서비스 객체에서 직접 가져오기
-            if not nodes:
-                # 워크플로우 객체에서 직접 노드 정보 가져오기
-                workflow = agent_service.workflow
-                if hasattr(workflow, 'nodes'):
-                    nodes = list(workflow.nodes.keys()) if hasattr(workflow.nodes, 'keys') else []
+            # 컴파일된 그래프(langchain_core Graph)에서 노드와 엣지 정보 추출
+            # nodes: {노드 ID: Node} 딕셔너리, edges: Edge(source, target, ...) 리스트
+            graph = agent_service.get_graph()
+            nodes = list(graph.nodes)
+            edges = [(edge.source, edge.target) for edge in graph.edges]
             
             # __start__와 __end__ 노드 명시적 추가
             if "__start__" not in nodes:
@@ -217,17 +177,17 @@ class ExportCommand:
             
             # 마크다운 코드블럭으로 감싸기
             mermaid_content = generate_mermaid_diagram(nodes, edges, tools, description, for_console=False)
-            markdown_content = f"""# LangGraph 워크플로우 구조
-
-```mermaid
-{mermaid_content}
-```
-"""
+            markdown_parts = [
+                "# LangGraph 워크플로우 구조",
+                "",
+                "```mermaid",
+                mermaid_content,
+                "```",
+            ]
             if description:
-                markdown_content += f"\n## 설명\n\n{description}\n"
+                markdown_parts.extend(["", "## 설명", "", description])
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            output_path.write_text("\n".join(markdown_parts) + "\n", encoding="utf-8")
             console.print(f"[green]✅ Mermaid 다이어그램이 '{output}' 파일에 저장되었습니다.[/green]")
         except Exception as e:
             console.print(f"[red]❌ Mermaid 다이어그램 생성 실패: {e}[/red]")
@@ -249,9 +209,9 @@ class ExportCommand:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # JSON 데이터 생성
+            # JSON 데이터 생성 (엣지는 _extract_graph_structure에서 이미 (source, target) 튜플로 정규화됨)
             node_list = [{"id": node, "type": "node", "label": node} for node in nodes]
-            edge_list = [{"source": edge[0], "target": edge[1]} for edge in edges if isinstance(edge, (list, tuple)) and len(edge) >= 2]
+            edge_list = [{"source": source, "target": target} for source, target in edges]
             
             # 도구 정보 추가
             tool_list = []
@@ -268,11 +228,10 @@ class ExportCommand:
                 "edges": edge_list,
                 "tools": tool_list,
                 "workflow": "LangGraph Assistant",
-                "description": description or "입력 처리 → 응답 생성 → 출력 포맷팅 워크플로우"
+                "description": description or "입력 처리 → 응답 생성 (필요 시 도구 호출) 워크플로우"
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(graph_data, f, ensure_ascii=False, indent=2)
+            output_path.write_bytes(to_json_bytes(graph_data))
             console.print(f"[green]✅ 그래프 구조가 '{output}' 파일에 저장되었습니다.[/green]")
         except Exception as e:
             console.print(f"[red]❌ JSON 형식 생성 실패: {e}[/red]")
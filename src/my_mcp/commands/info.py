@@ -2,11 +2,10 @@
 정보 출력 명령어 비즈니스 로직
 """
 
-import json
 import asyncio
 from rich.console import Console
 from rich.table import Table
-from ..utils.output_utils import CommonOptions, OutputFormat
+from ..utils.output_utils import CommonOptions, OutputFormat, to_json_bytes, to_yaml, write_stdout_bytes
 from ..logging import get_logger
 from ..tools import get_tool_registry
 from ..mcp import mcp_registry, mcp_client_manager
@@ -91,31 +90,39 @@ class InfoCommand:
                     "servers": [server.to_dict() for server in mcp_servers]
                 }
             
-            console.print(json.dumps(data, ensure_ascii=False, indent=2))
+            # Rich 마크업 파싱/줄바꿈 없이 그대로 출력
+            write_stdout_bytes(to_json_bytes(data) + b"\n")
         elif options and options.output_format == OutputFormat.yaml:
-            console.print("name: LangGraph 챗봇")
-            console.print(f"version: {self.version}")
-            console.print("description: OpenAI API를 이용한 LangGraph 기반 챗봇 CLI 도구입니다.")
-            console.print("tools:")
-            console.print("  built_in:")
-            console.print(f"    total: {tool_count['total']}")
-            console.print(f"    enabled: {tool_count['enabled']}")
-            console.print(f"    disabled: {tool_count['disabled']}")
+            data = {
+                "name": "LangGraph 챗봇",
+                "version": self.version,
+                "description": "OpenAI API를 이용한 LangGraph 기반 챗봇 CLI 도구입니다.",
+                "tools": {
+                    "built_in": {
+                        "total": tool_count["total"],
+                        "enabled": tool_count["enabled"],
+                        "disabled": tool_count["disabled"]
+                    }
+                }
+            }
             
             # MCP 서버가 있을 때만 MCP 정보 추가
             if mcp_server_configs:
-                console.print("  mcp:")
-                console.print(f"    total: {len(mcp_tools)}")
-                console.print("mcp_servers:")
-                console.print(f"  total: {mcp_status['total']}")
-                console.print(f"  enabled: {mcp_status['enabled']}")
-                console.print(f"  connected: {mcp_status['connected']}")
+                data["tools"]["mcp"] = {"total": len(mcp_tools)}
+                data["mcp_servers"] = {
+                    "total": mcp_status["total"],
+                    "enabled": mcp_status["enabled"],
+                    "connected": mcp_status["connected"]
+                }
+            
+            write_stdout_bytes(to_yaml(data).encode("utf-8"))
         else:
-            # 텍스트 형식으로 출력
-            console.print("[bold blue]🤖 LangGraph 챗봇[/bold blue]")
-            console.print(f"버전: {self.version}")
-            console.print("OpenAI API를 이용한 LangGraph 기반 챗봇 CLI 도구입니다.")
-            console.print()
+            # 텍스트 형식으로 출력 (머리말은 한 번의 print로 렌더링)
+            console.print(
+                "[bold blue]🤖 LangGraph 챗봇[/bold blue]\n"
+                f"버전: {self.version}\n"
+                "OpenAI API를 이용한 LangGraph 기반 챗봇 CLI 도구입니다.\n"
+            )
             
             # 도구 정보 테이블 생성
             self._display_tool_info(tool_info, tool_count)
@@ -135,9 +142,10 @@ class InfoCommand:
             tool_info: 도구 정보 목록
             tool_count: 도구 개수 정보
         """
-        console.print("[bold green]🔧 사용 가능한 도구[/bold green]")
-        console.print(f"총 {tool_count['total']}개 도구 (활성화: {tool_count['enabled']}개, 비활성화: {tool_count['disabled']}개)")
-        console.print()
+        console.print(
+            "[bold green]🔧 사용 가능한 도구[/bold green]\n"
+            f"총 {tool_count['total']}개 도구 (활성화: {tool_count['enabled']}개, 비활성화: {tool_count['disabled']}개)\n"
+        )
         
         if tool_info:
             table = Table(title="도구 목록")
@@ -165,9 +173,10 @@ class InfoCommand:
             status: MCP 서버 상태 요약
             tools: MCP 도구 목록
         """
-        console.print("[bold green]🌐 MCP 서버[/bold green]")
-        console.print(f"총 {status['total']}개 서버 (활성화: {status['enabled']}개, 연결됨: {status['connected']}개)")
-        console.print()
+        console.print(
+            "[bold green]🌐 MCP 서버[/bold green]\n"
+            f"총 {status['total']}개 서버 (활성화: {status['enabled']}개, 연결됨: {status['connected']}개)\n"
+        )
         
         if servers:
             # 서버 정보 테이블
@@ -203,9 +212,10 @@ class InfoCommand:
         
         # MCP 도구 정보
         if tools:
-            console.print("[bold green]🔧 MCP 도구[/bold green]")
-            console.print(f"총 {len(tools)}개 도구 사용 가능")
-            console.print()
+            console.print(
+                "[bold green]🔧 MCP 도구[/bold green]\n"
+                f"총 {len(tools)}개 도구 사용 가능\n"
+            )
             
             tool_table = Table(title="MCP 도구 목록")
             tool_table.add_column("도구명", style="cyan", no_wrap=True)
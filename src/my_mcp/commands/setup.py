@@ -2,7 +2,6 @@
 설정 명령어 비즈니스 로직
 """
 
-import shutil
 from pathlib import Path
 from rich.console import Console
 from ..logging import get_logger
@@ -36,8 +35,8 @@ class SetupCommand:
             return
         
         try:
-            # 템플릿 파일 복사
-            shutil.copy2(self.sample_file, self.settings_file)
+            # 템플릿 파일 내용 복사 (작은 파일이므로 한 번에 읽고 쓰며, 메타데이터는 복사하지 않음)
+            self.settings_file.write_bytes(self.sample_file.read_bytes())
             
             console.print(f"[green]✅ 설정 파일이 생성되었습니다: {self.settings_file}[/green]")
             console.print("[yellow]settings.yaml 파일을 편집하여 OpenAI API 키를 설정하세요.[/yellow]")
@@ -1,7 +1,9 @@
 """
 Configuration management using Dynaconf
 """
+import functools
 from pathlib import Path
+from types import MappingProxyType
 from dynaconf import Dynaconf
 from loguru import logger
 
@@ -11,6 +13,12 @@ try:
 except ImportError:
     tomllib = None
 
+# TOML 로더 (tomllib이 없으면 None)
+_load_toml = tomllib.load if tomllib else None
+
+# 설치된 패키지 이름 (importlib.metadata 조회용)
+PACKAGE_NAME = "my-mcp"
+
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -22,21 +30,30 @@ settings = Dynaconf(
     settings_files=[str(SETTINGS_FILE)],
 )
 
+@functools.lru_cache(maxsize=1)
 def get_version():
-    """pyproject.toml에서 버전 정보를 읽어옵니다."""
+    """패키지 버전 정보를 읽어옵니다. (설치 메타데이터 우선, 없으면 pyproject.toml)"""
     try:
+        from importlib.metadata import PackageNotFoundError, version as package_version
+        
+        try:
+            return package_version(PACKAGE_NAME)
+        except PackageNotFoundError:
+            # 설치되지 않은 개발 체크아웃에서는 pyproject.toml로 폴백
+            pass
+        
         pyproject_path = PROJECT_ROOT / "pyproject.toml"
         
         if not pyproject_path.exists():
             logger.warning(f"pyproject.toml 파일을 찾을 수 없습니다: {pyproject_path}")
             return "0.1.0"  # 기본값
         
-        if tomllib is None:
+        if _load_toml is None:
             logger.warning("tomllib 모듈을 찾을 수 없습니다. 기본 버전을 사용합니다.")
             return "0.1.0"
         
         with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+            data = _load_toml(f)
             version = data.get("project", {}).get("version", "0.1.0")
             return version
     
@@ -44,23 +61,28 @@ def get_version():
         logger.error(f"버전 정보 읽기 실패: {e}")
         return "0.1.0"  # 기본값
 
+@functools.lru_cache(maxsize=1)
 def get_openai_config():
-    """OpenAI API 설정 반환"""
-    return {
-        "api_key": settings.openai.api_key,
-        "model": settings.get("openai.model", "gpt-4o-mini"),
-        "temperature": settings.get("openai.temperature", 0.7),
-        "max_tokens": settings.get("openai.max_tokens", 1000),
-        "streaming": settings.get("openai.streaming", True),
-    }
+    """OpenAI API 설정 반환 (최초 1회만 Dynaconf 조회 후 캐싱)"""
+    openai = settings.openai
+    return MappingProxyType({
+        "api_key": openai.api_key,
+        "model": openai.get("model", "gpt-4o-mini"),
+        "temperature": openai.get("temperature", 0.7),
+        "max_tokens": openai.get("max_tokens", 1000),
+        "streaming": openai.get("streaming", True),
+        "cache": openai.get("cache", True),
+    })
 
+@functools.lru_cache(maxsize=1)
 def get_chatbot_config():
-    """챗봇 설정 반환"""
-    return {
-        "name": settings.get("chatbot.name", "LangGraph Assistant"),
-        "welcome_message": settings.get("chatbot.welcome_message", "안녕하세요! LangGraph 챗봇입니다."),
-        "system_prompt": settings.get("chatbot.system_prompt", "당신은 도움이 되는 AI 어시스턴트입니다."),
-    }
+    """챗봇 설정 반환 (최초 1회만 Dynaconf 조회 후 캐싱)"""
+    chatbot = settings.get("chatbot") or {}
+    return MappingProxyType({
+        "name": chatbot.get("name", "LangGraph Assistant"),
+        "welcome_message": chatbot.get("welcome_message", "안녕하세요! LangGraph 챗봇입니다."),
+        "system_prompt": chatbot.get("system_prompt", "당신은 도움이 되는 AI 어시스턴트입니다."),
+    })
 
 
 
@@ -73,16 +95,21 @@ def is_verbose():
     return settings.get("development.verbose", False)
 
 def get_mcp_servers():
-    """MCP 서버 설정 반환"""
+    """MCP 서버 설정 반환 (검증 결과는 최초 1회만 계산 후 캐싱)"""
+    return list(_load_mcp_servers())
+
+@functools.lru_cache(maxsize=1)
+def _load_mcp_servers():
+    """MCP 서버 설정을 읽고 검증하여 유효한 서버 튜플 반환"""
     mcp_servers = settings.get("mcp_servers", [])
     
-    # mcp_servers가 None인 경우 빈 리스트 반환
+    # mcp_servers가 None인 경우 빈 튜플 반환
     if mcp_servers is None:
-        return []
+        return ()
     
     # 빈 리스트인 경우 그대로 반환
     if not mcp_servers:
-        return []
+        return ()
     
     valid_servers = []
     
@@ -112,15 +139,49 @@ def get_mcp_servers():
         valid_servers.append(server)
         logger.debug(f"유효한 MCP 서버: {server.get('name')} - {server.get('url')}")
     
-    return valid_servers
+    return tuple(valid_servers)
+
+# 마지막으로 확인한 설정 파일 mtime_ns (파일이 없었으면 -1, 확인 전이면 None)와 그때의 검증 성공 여부
+_checked_settings_mtime_ns = None
+_settings_valid = False
+
+def _reload_settings():
+    """설정 파일을 다시 읽고 설정 값 캐시를 비웁니다."""
+    settings.reload()
+    get_openai_config.cache_clear()
+    get_chatbot_config.cache_clear()
+    _load_mcp_servers.cache_clear()
 
 def check_settings():
-    """설정 파일 존재 여부 확인"""
-    if not SETTINGS_FILE.exists():
+    """
+    설정 파일 존재 여부 확인
+    
+    설정 파일 mtime이 같고 이전 검증이 성공했으면 결과를 재사용합니다.
+    파일이 바뀌었으면 설정을 다시 읽고, 실패한 결과는 캐시하지 않아 매번 오류 안내를 출력합니다.
+    """
+    global _checked_settings_mtime_ns, _settings_valid
+    
+    try:
+        mtime_ns = SETTINGS_FILE.stat().st_mtime_ns
+    except OSError:
+        _checked_settings_mtime_ns, _settings_valid = -1, False
         logger.error(f"설정 파일이 없습니다: {SETTINGS_FILE}")
         logger.info(f"settings.sample.yaml을 {SETTINGS_FILE.name}로 복사하여 설정을 완료하세요.")
         return False
     
+    if mtime_ns == _checked_settings_mtime_ns:
+        if _settings_valid:
+            return True
+    elif _checked_settings_mtime_ns is not None:
+        # 마지막 확인 이후 설정 파일이 바뀌었으면 이전에 읽은 설정을 버림
+        _reload_settings()
+    
+    _checked_settings_mtime_ns = mtime_ns
+    _settings_valid = _validate_settings()
+    return _settings_valid
+
+def _validate_settings():
+    """설정 파일 내용 검증"""
     # API 키 확인
     try:
         api_key = settings.openai.api_key
@@ -133,4 +194,4 @@ def check_settings():
         return True
     except Exception as e:
         logger.error(f"설정 파일 읽기 오류: {e}")
-        return False 
\ No newline at end of file
+        return False
@@ -15,9 +15,13 @@ class MCPClient:
         self.servers = servers
         self.client: Optional[MultiServerMCPClient] = None
         self.tools: List[Any] = []
+        self.connection_results: Dict[str, bool] = {}
+        # 도구 정보 캐시 (도구 목록은 initialize()에서만 바뀌므로 그때 무효화)
+        self._tool_info: Optional[Dict[str, Any]] = None
         
     async def initialize(self) -> bool:
         """MCP 클라이언트 초기화"""
+        self._tool_info = None
         try:
             # 서버 설정 변환
             server_config = {}
@@ -31,17 +35,36 @@ class MCPClient:
             # MultiServerMCPClient 초기화
             self.client = MultiServerMCPClient(server_config)
             
-            # 도구 가져오기 (이 과정에서 실제 연결 상태가 확인됨)
-            self.tools = await self.client.get_tools()
+            # 서버별 도구 가져오기를 동시에 실행 (이 과정에서 실제 연결 상태가 확인됨)
+            # 예외를 결과로 받아 한 서버의 실패가 다른 서버의 도구 로드를 막지 않도록 함
+            server_names = list(server_config)
+            results = await asyncio.gather(
+                *(self.client.get_tools(server_name=name) for name in server_names),
+                return_exceptions=True
+            )
             
-            # get_tools() 호출이 성공했다면 연결 성공으로 간주
+            # get_tools() 호출이 성공한 서버는 연결 성공으로 간주
             # 도구가 없어도 연결 자체는 성공한 것으로 판단
+            self.tools = []
+            self.connection_results = {}
+            for name, result in zip(server_names, results):
+                if isinstance(result, Exception):
+                    logger.error(f"MCP 서버 연결 실패 ({name}): {result}")
+                    self.connection_results[name] = False
+                elif isinstance(result, BaseException):
+                    # 취소 등은 실패로 처리하지 않고 그대로 전달
+                    raise result
+                else:
+                    self.tools.extend(result)
+                    self.connection_results[name] = True
+            
             logger.info(f"MCP 클라이언트 초기화 완료: {len(self.tools)}개 도구")
-            return True
+            return any(self.connection_results.values())
             
         except Exception as e:
             logger.error(f"MCP 클라이언트 초기화 실패: {e}")
             self.tools = []
+            self.connection_results = {server.name: False for server in self.servers}
             return False
     
     async def close(self):
@@ -55,7 +78,10 @@ class MCPClient:
         return self.tools
     
     def get_tool_info(self) -> Dict[str, Any]:
-        """도구 정보 반환"""
+        """도구 정보 반환 (인자 스키마 생성 비용이 크므로 처음 한 번만 만들고 재사용)"""
+        if self._tool_info is not None:
+            return self._tool_info
+        
         tool_info = {}
         for tool in self.tools:
             # 서버 정보 추가
@@ -78,6 +104,7 @@ class MCPClient:
                 "server": server_name or "Unknown",
                 "args_schema": tool.args_schema.schema() if hasattr(tool.args_schema, 'schema') else str(tool.args_schema)
             }
+        self._tool_info = tool_info
         return tool_info
 
 
@@ -112,6 +139,12 @@ class MCPClientManager:
             return self.client.get_tools()
         return []
     
+    def get_connection_results(self) -> Dict[str, bool]:
+        """서버별 연결 성공 여부 반환"""
+        if self.client:
+            return dict(self.client.connection_results)
+        return {}
+    
     def get_tool_info(self) -> Dict[str, Any]:
         """도구 정보 반환"""
         if self.client:
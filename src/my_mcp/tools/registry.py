@@ -17,6 +17,8 @@ class ToolRegistry:
         self._tools: Dict[str, BaseTool] = {}
         self._tool_status: Dict[str, bool] = {}
         self._tool_descriptions: Dict[str, str] = {}
+        # 활성화된 도구 목록 캐시 (등록/활성화 상태가 바뀌면 무효화)
+        self._enabled_tools_cache: Optional[List[BaseTool]] = None
         
     def register_tool(self, tool: BaseTool, enabled: bool = True) -> None:
         """
@@ -31,6 +33,7 @@ class ToolRegistry:
             self._tools[tool_name] = tool
             self._tool_status[tool_name] = enabled
             self._tool_descriptions[tool_name] = tool.description
+            self._enabled_tools_cache = None
             
             logger.debug(f"도구 등록: {tool_name} (활성화: {enabled})")
             
@@ -56,10 +59,12 @@ class ToolRegistry:
         Returns:
             활성화된 도구 목록
         """
-        return [
-            tool for tool_name, tool in self._tools.items() 
-            if self._tool_status.get(tool_name, False)
-        ]
+        if self._enabled_tools_cache is None:
+            self._enabled_tools_cache = [
+                tool for tool_name, tool in self._tools.items() 
+                if self._tool_status.get(tool_name, False)
+            ]
+        return list(self._enabled_tools_cache)
     
     def get_all_tools(self) -> Dict[str, BaseTool]:
         """
@@ -101,6 +106,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             self._tool_status[tool_name] = True
+            self._enabled_tools_cache = None
             logger.debug(f"도구 활성화: {tool_name}")
             return True
         return False
@@ -117,6 +123,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             self._tool_status[tool_name] = False
+            self._enabled_tools_cache = None
             logger.debug(f"도구 비활성화: {tool_name}")
             return True
         return False
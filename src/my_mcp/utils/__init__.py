@@ -1,16 +1,39 @@
 """
 Utils 패키지 - 공통 유틸리티 함수들
+
+각 유틸리티 모듈은 필요한 시점에 지연 import 됩니다.
+(main.py가 output_utils만 사용할 때 rich 등을 끌어오는 markdown/diagram 모듈까지 불러오지 않기 위함)
 """
 
-from .output_utils import output_result, OutputFormat, CommonOptions
-from .markdown_utils import save_conversation_to_markdown
-from .diagram_utils import generate_mermaid_diagram, generate_ai_description_sync
+import importlib
+
+_UTIL_MODULES = {
+    "output_result": ".output_utils",
+    "OutputFormat": ".output_utils",
+    "CommonOptions": ".output_utils",
+    "OPTIONS": ".output_utils",
+    "ConversationMarkdownWriter": ".markdown_utils",
+    "generate_mermaid_diagram": ".diagram_utils",
+    "generate_ai_description_sync": ".diagram_utils",
+}
 
 __all__ = [
     "output_result",
     "OutputFormat",
     "CommonOptions",
-    "save_conversation_to_markdown",
+    "OPTIONS",
+    "ConversationMarkdownWriter",
     "generate_mermaid_diagram",
     "generate_ai_description_sync"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """유틸리티 함수/클래스를 처음 접근할 때 해당 모듈을 import 합니다."""
+    module_name = _UTIL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attribute = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = attribute
+    return attribute
@@ -2,11 +2,74 @@
 다이어그램 관련 유틸리티 함수들
 """
 
-from langchain.schema import HumanMessage, SystemMessage
+import functools
 from ..logging import get_logger
 
 logger = get_logger("my_mcp.utils.diagram")
 
+# 시작/종료 노드와 이스케이프 처리된 표시 이름 (라운드 사각형으로 표시)
+_START_END_LABELS = {node: node.replace("_", r"\_") for node in ("__start__", "__end__")}
+
+# Mermaid 노드 ID/라벨 정리용 변환 테이블 (str.translate로 한 번에 치환)
+_MERMAID_ID_TRANSLATE = str.maketrans(dict.fromkeys(" -.\"'[](){}", "_"))
+_MERMAID_LABEL_ESCAPE = str.maketrans({'"': "'", "\n": " "})
+
+# 다이어그램 공통 스타일 정의 (글씨 검은색으로) - 입력과 무관하므로 모듈 로드 시 한 번만 생성
+_MERMAID_STYLE_BLOCK = "\n".join([
+    "",
+    "    classDef startEnd fill:#e1f5fe,stroke:#01579b,stroke-width:2px,color:#000;",
+    "    classDef process fill:#f3e5f5,stroke:#4a148c,stroke-width:2px,color:#000;",
+    "    classDef generate fill:#e8f5e8,stroke:#1b5e20,stroke-width:2px,color:#000;",
+    "    classDef basicTool fill:#fce4ec,stroke:#880e4f,stroke-width:2px,color:#000;",
+    "    classDef mcpTool fill:#e3f2fd,stroke:#0277bd,stroke-width:2px,color:#000;",
+    "",
+    "    class __start__,__end__ startEnd",
+    "    class process_input process",
+    "    class generate_response generate",
+])
+
+
+def _mermaid_id(name) -> str:
+    """Mermaid 노드 ID로 쓸 수 없는 문자(공백, -, ., 따옴표, 괄호)를 밑줄로 바꿉니다."""
+    return str(name).translate(_MERMAID_ID_TRANSLATE)
+
+
+def _mermaid_label(name) -> str:
+    """Mermaid 라벨 안에서 문법을 깨뜨리는 문자(큰따옴표, 줄바꿈)를 치환합니다."""
+    return str(name).translate(_MERMAID_LABEL_ESCAPE)
+
+
+def _iter_edge_pairs(edges):
+    """
+    엣지 목록에서 (source, target) 쌍만 꺼냅니다.
+    두 개 이상의 값으로 풀 수 없는 엣지는 건너뜁니다.
+    
+    Args:
+        edges: 그래프 엣지 리스트
+        
+    Yields:
+        (source, target) 튜플
+    """
+    for edge in edges:
+        try:
+            source, target, *_ = edge
+        except (TypeError, ValueError):
+            continue
+        yield source, target
+
+
+@functools.lru_cache(maxsize=1)
+def _get_message_classes():
+    """
+    LangChain 메시지 클래스를 최초 1회만 import 하여 반환합니다.
+    (--ai-description을 사용하지 않으면 langchain.schema를 불러오지 않음)
+    
+    Returns:
+        (HumanMessage, SystemMessage) 튜플
+    """
+    from langchain.schema import HumanMessage, SystemMessage
+    return HumanMessage, SystemMessage
+
 
 def generate_ai_description_sync(agent_service, nodes, edges, tools=None) -> str:
     """
@@ -21,16 +84,15 @@ def generate_ai_description_sync(agent_service, nodes, edges, tools=None) -> str
     Returns:
         AI가 생성한 설명
     """
+    HumanMessage, SystemMessage = _get_message_classes()
+    
     try:
         # 그래프 구조 정보 정리
         node_info = []
         for node in nodes:
             node_info.append(f"{node}")
         
-        edge_info = []
-        for edge in edges:
-            if isinstance(edge, (list, tuple)) and len(edge) >= 2:
-                edge_info.append(f"{edge[0]} → {edge[1]}")
+        edge_info = [f"{source} → {target}" for source, target in _iter_edge_pairs(edges)]
         
         # 도구 정보 정리
         basic_tool_info = []
@@ -118,70 +180,49 @@ def generate_mermaid_diagram(nodes, edges, tools=None, description=None, for_con
         if not nodes or not edges:
             raise ValueError("그래프 정보를 추출할 수 없습니다.")
         
-        mermaid_lines = ["graph TD"]
-        
         # 노드 정의 (__start__와 __end__는 라운드 사각형으로, 이스케이프 처리)
-        for node in nodes:
-            if node in ["__start__", "__end__"]:
-                # __start__와 __end__ 노드는 이스케이프 처리하여 표시
-                escaped_node = node.replace("_", r"\_")
-                mermaid_lines.append(f'    {node}(["{escaped_node}"])')
-            else:
-                mermaid_lines.append(f'    {node}["{node}"]')
+        node_lines = [
+            f'    {node}(["{_START_END_LABELS[node]}"])' if node in _START_END_LABELS
+            else f'    {_mermaid_id(node)}["{_mermaid_label(node)}"]'
+            for node in nodes
+        ]
         
-        # 기본 도구 노드 추가
+        # 도구 노드 정의 (MCP 도구는 서버 정보를 포함하여 표시)
+        tools = tools or []
+        tool_lines = []
         basic_tools = []
         mcp_tools = []
+        tool_ids = []
+        for tool in tools:
+            tool_id = _mermaid_id(tool["name"])
+            tool_label = _mermaid_label(tool["name"])
+            tool_ids.append(tool_id)
+            if tool.get("type", "basic") == "mcp":
+                mcp_tools.append(tool_id)
+                server_label = _mermaid_label(tool.get("server", "Unknown"))
+                tool_lines.append(f'    {tool_id}["{tool_label}<br/>({server_label})"]')
+            else:
+                basic_tools.append(tool_id)
+                tool_lines.append(f'    {tool_id}["{tool_label}"]')
         
-        if tools:
-            for tool in tools:
-                tool_name = tool["name"]
-                tool_type = tool.get("type", "basic")
-                
-                if tool_type == "mcp":
-                    server = tool.get("server", "Unknown")
-                    # MCP 도구는 서버 정보를 포함하여 표시
-                    mcp_tools.append(tool_name)
-                    mermaid_lines.append(f'    {tool_name}["{tool_name}<br/>({server})"]')
-                else:
-                    basic_tools.append(tool_name)
-                    mermaid_lines.append(f'    {tool_name}["{tool_name}"]')
-        
-        # 엣지 정의 (원본 이름 그대로 사용)
-        for edge in edges:
-            if isinstance(edge, (list, tuple)) and len(edge) >= 2:
-                source, target = edge[0], edge[1]
-                mermaid_lines.append(f"    {source} --> {target}")
+        # 엣지 정의 (노드 정의와 같은 ID 사용)
+        edge_lines = [
+            f"    {_mermaid_id(source)} --> {_mermaid_id(target)}"
+            for source, target in _iter_edge_pairs(edges)
+        ]
         
         # call_tools 노드와 도구들 연결
-        if tools and "call_tools" in nodes:
-            for tool in tools:
-                tool_name = tool["name"]
-                mermaid_lines.append(f"    call_tools --> {tool_name}")
-        
-        # 스타일 추가 (글씨 검은색으로)
-        mermaid_lines.extend([
-            "",
-            "    classDef startEnd fill:#e1f5fe,stroke:#01579b,stroke-width:2px,color:#000;",
-            "    classDef process fill:#f3e5f5,stroke:#4a148c,stroke-width:2px,color:#000;",
-            "    classDef generate fill:#e8f5e8,stroke:#1b5e20,stroke-width:2px,color:#000;",
-            "    classDef format fill:#fff3e0,stroke:#e65100,stroke-width:2px,color:#000;",
-            "    classDef basicTool fill:#fce4ec,stroke:#880e4f,stroke-width:2px,color:#000;",
-            "    classDef mcpTool fill:#e3f2fd,stroke:#0277bd,stroke-width:2px,color:#000;",
-            "",
-            "    class __start__,__end__ startEnd",
-            "    class process_input process",
-            "    class generate_response generate", 
-            "    class format_output format"
-        ])
-        
-        # 기본 도구 노드에 스타일 적용
-        if basic_tools:
-            mermaid_lines.append(f"    class {','.join(basic_tools)} basicTool")
+        if "call_tools" in nodes:
+            edge_lines.extend(f"    call_tools --> {tool_id}" for tool_id in tool_ids)
         
-        # MCP 도구 노드에 스타일 적용
+        # 도구 노드 스타일 적용
+        class_lines = []
+        if basic_tools:
+            class_lines.append(f"    class {','.join(basic_tools)} basicTool")
         if mcp_tools:
-            mermaid_lines.append(f"    class {','.join(mcp_tools)} mcpTool")
+            class_lines.append(f"    class {','.join(mcp_tools)} mcpTool")
+        
+        mermaid_lines = ["graph TD", *node_lines, *tool_lines, *edge_lines, _MERMAID_STYLE_BLOCK, *class_lines]
         
         # 콘솔 출력일 때만 설명 추가
         if for_console and description:
@@ -3,40 +3,102 @@
 """
 
 import datetime
+from typing import Optional, TextIO
 from rich.console import Console
 from ..logging import get_logger
 
 console = Console()
 logger = get_logger("my_mcp.utils.markdown")
 
+# 대화 기록 파일 쓰기 버퍼 크기 (바이트)
+_WRITE_BUFFER_SIZE = 65536
 
-def save_conversation_to_markdown(conversation_log: list, filename: str):
-    """
-    대화 내용을 마크다운 파일로 저장합니다.
+
+def _normalize_markdown_filename(filename: str) -> str:
+    """파일명에 .md 확장자가 없으면 추가합니다."""
+    if not filename.endswith('.md'):
+        filename += '.md'
+    return filename
+
+
+def _conversation_header() -> str:
+    """대화 기록 마크다운 헤더를 생성합니다."""
+    return (
+        "# AI 대화 기록\n\n"
+        f"**생성일시**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        "---\n\n"
+    )
+
+
+class ConversationMarkdownWriter:
+    """대화 내용을 턴마다 마크다운 파일에 바로 기록하는 클래스"""
+    
+    def __init__(self, filename: str):
+        """
+        대화 기록 파일 작성기 초기화
+        
+        파일은 첫 번째 대화가 기록될 때 생성됩니다.
+        
+        Args:
+            filename: 저장할 파일명
+        """
+        self.filename = _normalize_markdown_filename(filename)
+        self._file: Optional[TextIO] = None
+        self._failed = False
+    
+    def write_turn(self, user_input: str, ai_response: str):
+        """
+        한 번의 대화(사용자 입력 + AI 응답)를 파일에 추가합니다.
+        
+        Args:
+            user_input: 사용자 입력
+            ai_response: AI 응답
+        """
+        if self._failed:
+            return
+        
+        try:
+            if self._file is None:
+                # 큰 버퍼로 열어 응답의 줄마다 flush 되지 않도록 함 (턴이 끝날 때 한 번만 flush)
+                self._file = open(self.filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+                self._file.write(_conversation_header())
+            
+            self._file.write(f"**사용자**: {user_input}\n\n**AI**: {ai_response}\n\n")
+            # 대화가 끝날 때마다 디스크에 반영
+            self._file.flush()
+        
+        except Exception as e:
+            # 저장 실패 시 이후 대화는 기록하지 않음 (대화 자체는 계속 진행)
+            self._report_failure(e)
+    
+    def _report_failure(self, error: Exception):
+        """
+        저장 실패를 기록하고 사용자에게 알립니다.
+        
+        Args:
+            error: 발생한 예외
+        """
+        self._failed = True
+        console.print(f"[red]파일 저장 실패: {error}[/red]")
+        logger.error(f"마크다운 저장 실패: {error}")
+    
+    def close(self):
+        """파일을 닫고 저장 결과를 출력합니다. (저장에 실패한 경우 완료 메시지를 출력하지 않음)"""
+        if self._file is None:
+            return
+        
+        try:
+            self._file.close()
+        except Exception as e:
+            self._report_failure(e)
+        finally:
+            self._file = None
+        
+        if not self._failed:
+            console.print(f"[green]✅ 대화 내용이 '{self.filename}' 파일에 저장되었습니다.[/green]")
+    
+    def __enter__(self):
+        return self
     
-    Args:
-        conversation_log: 대화 기록 리스트
-        filename: 저장할 파일명
-    """
-    try:
-        # 파일명 처리 (.md 확장자 추가)
-        if not filename.endswith('.md'):
-            filename += '.md'
-        
-        # 마크다운 내용 생성
-        markdown_content = f"# AI 대화 기록\n\n"
-        markdown_content += f"**생성일시**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        markdown_content += "---\n\n"
-        
-        for entry in conversation_log:
-            markdown_content += entry + "\n"
-        
-        # 파일 저장
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        console.print(f"[green]✅ 대화 내용이 '{filename}' 파일에 저장되었습니다.[/green]")
-        
-    except Exception as e:
-        console.print(f"[red]파일 저장 실패: {e}[/red]")
-        logger.error(f"마크다운 저장 실패: {e}") 
\ No newline at end of file
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -2,14 +2,112 @@
 출력 관련 유틸리티 함수들
 """
 
+import functools
 import json
+import sys
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
-from rich.console import Console
-from rich.text import Text
 
+# orjson이 설치되어 있으면 더 빠른 JSON 직렬화에 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Rich 콘솔을 처음 출력할 때 한 번만 생성합니다."""
+    from rich.console import Console
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml():
+    """
+    PyYAML을 YAML 출력이 처음 필요할 때 한 번만 import 합니다.
+    (import 비용이 커서 YAML을 쓰지 않는 명령어의 시작 시간에 포함되지 않도록 함)
+
+    Returns:
+        yaml 모듈 (설치되어 있지 않으면 None, 이 경우 간단한 내장 변환 사용)
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+def to_json_bytes(data) -> bytes:
+    """
+    데이터를 들여쓰기 2칸의 UTF-8 JSON 바이트로 직렬화합니다.
+    
+    Args:
+        data: 직렬화할 데이터
+        
+    Returns:
+        JSON 바이트 (비 ASCII 문자는 그대로 유지)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _yaml_scalar(value) -> str:
+    """YAML 값 하나를 문자열로 변환 (문자열/목록은 JSON 표기로 인용하여 특수문자 보호)"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _yaml_lines(data: dict, indent: int = 0):
+    """딕셔너리를 블록 형식 YAML 줄로 변환"""
+    pad = "  " * indent
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            yield f"{pad}{key}:"
+            yield from _yaml_lines(value, indent + 1)
+        else:
+            yield f"{pad}{key}: {_yaml_scalar(value)}"
+
+
+def to_yaml(data: dict) -> str:
+    """
+    딕셔너리를 YAML 문자열로 직렬화합니다.
+    
+    Args:
+        data: 직렬화할 데이터
+        
+    Returns:
+        YAML 문자열 (비 ASCII 문자는 그대로 유지, 키 순서 유지)
+    """
+    yaml = _get_yaml()
+    if yaml is not None:
+        return yaml.safe_dump(data, allow_unicode=True, sort_keys=False, default_flow_style=False)
+    return "\n".join(_yaml_lines(data)) + "\n"
+
+
+def write_stdout_bytes(data: bytes) -> None:
+    """
+    JSON/YAML 같은 기계 판독용 출력을 Rich 마크업 파싱/줄바꿈 없이 표준 출력에 그대로 씁니다.
+    
+    Args:
+        data: 출력할 UTF-8 바이트
+    """
+    stdout = sys.stdout
+    stdout.flush()
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(data.decode("utf-8"))
+        stdout.flush()
+    else:
+        buffer.write(data)
+        buffer.flush()
 
 
 class OutputFormat(str, Enum):
@@ -19,15 +117,55 @@ class OutputFormat(str, Enum):
     yaml = "yaml"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommonOptions:
-    """공통 옵션 데이터 클래스"""
+    """공통 옵션 데이터 클래스 (__slots__ 사용으로 속성 접근이 빠르고 메모리 사용이 적음)"""
     verbose: bool = False
     quiet: bool = False
     output_format: OutputFormat = OutputFormat.text
     config_file: str = None
 
 
+# 현재 명령어 실행의 공통 옵션 (main_callback에서 설정, 비동기 태스크마다 독립적인 컨텍스트)
+OPTIONS: ContextVar[CommonOptions] = ContextVar("options")
+
+
+def _emit_text(console, message: str, style: str = ""):
+    """텍스트 형식 출력"""
+    if style:
+        from rich.text import Text
+        console.print(Text(message, style=style))
+    else:
+        console.print(message)
+
+
+# JSON 출력의 고정 부분 (메시지 값만 직렬화해 끼워 넣음, 들여쓰기 2칸 형식과 동일)
+_MESSAGE_JSON_PREFIX = b'{\n  "message": '
+_MESSAGE_JSON_SUFFIX = b',\n  "status": "success"\n}\n'
+
+
+def _emit_json(console, message: str, style: str = ""):
+    """JSON 형식 출력"""
+    write_stdout_bytes(_MESSAGE_JSON_PREFIX + to_json_bytes(message) + _MESSAGE_JSON_SUFFIX)
+
+
+def _emit_yaml(console, message: str, style: str = ""):
+    """YAML 형식 출력"""
+    data = {"message": message, "status": "success"}
+    write_stdout_bytes(to_yaml(data).encode("utf-8"))
+
+
+# 출력 형식별 출력 함수
+_EMITTERS = {
+    OutputFormat.text: _emit_text,
+    OutputFormat.json: _emit_json,
+    OutputFormat.yaml: _emit_yaml,
+}
+
+# 옵션이 주어지지 않았을 때 사용할 기본 옵션
+_DEFAULT_OPTIONS = CommonOptions()
+
+
 def output_result(message: str, style: str = "", options: CommonOptions = None):
     """
     공통 출력 함수
@@ -35,23 +173,15 @@ def output_result(message: str, style: str = "", options: CommonOptions = None):
     Args:
         message: 출력할 메시지
         style: 텍스트 스타일
-        options: 공통 옵션
+        options: 공통 옵션 (없으면 현재 컨텍스트의 OPTIONS 사용)
     """
-    if options and options.quiet:
+    if options is None:
+        options = OPTIONS.get(_DEFAULT_OPTIONS)
+    if options.quiet:
         return
 
-    if options and options.output_format == OutputFormat.json:
-        data = {"message": message, "status": "success"}
-        console.print(json.dumps(data, ensure_ascii=False, indent=2))
-    elif options and options.output_format == OutputFormat.yaml:
-        console.print(f"message: {message}")
-        console.print("status: success")
-    else:
-        if style:
-            text = Text(message, style=style)
-            console.print(text)
-        else:
-            console.print(message)
+    console = _get_console()
+    _EMITTERS[options.output_format](console, message, style)
 
-    if options and options.verbose:
-        console.print(f"[dim]설정 파일: {options.config_file or 'None'}[/dim]") 
\ No newline at end of file
+    if options.verbose:
+        console.print(f"[dim]설정 파일: {options.config_file or 'None'}[/dim]")
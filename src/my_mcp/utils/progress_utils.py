@@ -0,0 +1,50 @@
+"""
+진행 상태(스피너) 표시 관련 유틸리티 함수들
+"""
+
+import sys
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+from .output_utils import OPTIONS
+
+# 작업 설명 컬럼 형식
+_DESCRIPTION_FORMAT = "[progress.description]{task.description}"
+
+
+class _NullProgress:
+    """스피너를 표시하지 않을 때 사용하는 Progress 대체 객체 (아무것도 출력하지 않음)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def add_task(self, description: str, **kwargs) -> int:
+        """작업 추가 (표시하지 않음)"""
+        return 0
+
+    def update(self, task_id: int, **kwargs) -> None:
+        """작업 상태 갱신 (표시하지 않음)"""
+
+
+def _is_interactive() -> bool:
+    """스피너를 표시할 수 있는 상황인지 확인 (터미널 출력이고 조용한 모드가 아닐 때)"""
+    options = OPTIONS.get(None)
+    if options is not None and options.quiet:
+        return False
+    return sys.stdout.isatty()
+
+
+def spinner_progress():
+    """
+    작업 설명과 스피너를 표시하는 일시적(transient) Progress를 생성합니다.
+    조용한 모드이거나 출력이 터미널이 아니면 (파이프/CI) 아무것도 하지 않는 객체를 반환합니다.
+
+    Returns:
+        Progress 인스턴스 또는 같은 인터페이스의 no-op 객체 (with 문으로 사용)
+    """
+    if not _is_interactive():
+        return _NullProgress()
+    # SpinnerColumn은 스피너 시작 시각/프레임 상태를 가지므로 Progress마다 새로 생성
+    return Progress(SpinnerColumn(), TextColumn(_DESCRIPTION_FORMAT), transient=True)
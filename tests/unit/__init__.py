@@ -0,0 +1 @@
+"""Unit tests for my_mcp internals"""
@@ -0,0 +1,41 @@
+"""Fixtures for unit tests (OpenAI API를 호출하지 않는 범위에서 내부 동작을 검증)"""
+
+import pytest
+
+from my_mcp.agent import service as service_module
+
+
+# 테스트용 OpenAI 설정 (temperature 0: 응답 캐시 경로 포함)
+OPENAI_CONFIG = {
+    "api_key": "test-api-key",
+    "model": "gpt-4o-mini",
+    "temperature": 0,
+    "max_tokens": 100,
+    "streaming": True,
+    "cache": True,
+}
+
+# 테스트용 에이전트 설정
+AGENT_CONFIG = {
+    "name": "Test Assistant",
+    "welcome_message": "테스트 환영 메시지",
+    "system_prompt": "You are a test assistant.",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """모듈 수준 캐시가 테스트 사이에 공유되지 않도록 초기화"""
+    service_module._llm_cache.clear()
+    service_module._agent_service_cache.clear()
+    service_module._LLM_RESPONSE_CACHE.clear()
+    yield
+    service_module._llm_cache.clear()
+    service_module._agent_service_cache.clear()
+    service_module._LLM_RESPONSE_CACHE.clear()
+
+
+@pytest.fixture
+def agent_service():
+    """MCP 서버 없이 생성한 AgentService 인스턴스"""
+    return service_module.AgentService(dict(OPENAI_CONFIG), dict(AGENT_CONFIG))
@@ -0,0 +1,452 @@
+"""Unit tests for AgentService"""
+
+import asyncio
+import json
+import re
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import tool
+from langchain_openai import ChatOpenAI
+
+from my_mcp.agent import service as service_module
+
+from .conftest import AGENT_CONFIG, OPENAI_CONFIG
+
+
+@tool
+def remote_echo(text: str) -> str:
+    """입력 문자열을 그대로 반환하는 테스트용 MCP 도구"""
+    return text
+
+
+# 테스트용 도구 호출 기록
+tick_calls = MagicMock()
+
+
+@tool
+def current_tick() -> str:
+    """호출될 때마다 증가하는 값을 반환하는 테스트용 도구"""
+    tick_calls()
+    return f"tick {tick_calls.call_count}"
+
+
+def tool_calling_generate(messages, *args, **kwargs):
+    """첫 생성은 current_tick 도구를 호출하고, 도구 결과를 받으면 결과를 답변하는 가짜 모델"""
+    last_message = messages[-1]
+    if isinstance(last_message, ToolMessage):
+        message = AIMessage(content=f"결과: {last_message.content}")
+    else:
+        message = AIMessage(content="", tool_calls=[{"name": "current_tick", "args": {}, "id": "call_1"}])
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def remote_echo_generate(messages, *args, **kwargs):
+    """MCP 도구(remote_echo)를 호출하고, 도구 결과를 받으면 결과를 답변하는 가짜 모델"""
+    last_message = messages[-1]
+    if isinstance(last_message, ToolMessage):
+        message = AIMessage(content=f"결과: {last_message.content}")
+    else:
+        message = AIMessage(content="", tool_calls=[{"name": "remote_echo", "args": {"text": "메아리"}, "id": "call_1"}])
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    """미리 정한 응답을 순서대로 반환하는 가짜 채팅 모델 (스트리밍 시 단어/공백 단위 토큰 전달)"""
+    
+    responses: List[AIMessage]
+    calls: int = 0
+    
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+    
+    def _next_response(self) -> AIMessage:
+        response = self.responses[self.calls]
+        self.calls += 1
+        return response
+    
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=self._next_response())])
+    
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        response = self._next_response()
+        if response.tool_calls:
+            # 도구 호출은 토큰 없이 하나의 청크로 전달 (OpenAI 스트리밍과 같은 형태)
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": index}
+                for index, call in enumerate(response.tool_calls)
+            ]))
+            return
+        for token in re.split(r"(\s+)", response.content):
+            if token:
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+@pytest.fixture
+def fake_openai_generate():
+    """OpenAI API 대신 고정 응답을 반환하는 생성 함수 (호출 횟수 기록)"""
+    generate = MagicMock(return_value=ChatResult(generations=[ChatGeneration(message=AIMessage(content="테스트 응답"))]))
+    with patch.object(ChatOpenAI, "_generate", lambda self, *args, **kwargs: generate(*args, **kwargs)):
+        yield generate
+
+
+def make_service(tools=None, **openai_overrides):
+    """
+    OpenAI 설정 일부를 바꿔 AgentService 생성 (응답 캐시 테스트는 비스트리밍 경로 사용)
+    
+    Args:
+        tools: 내장 도구 대신 사용할 도구 목록 (없으면 기본 도구 레지스트리 사용)
+        **openai_overrides: 덮어쓸 OpenAI 설정 값
+    """
+    openai_config = {**OPENAI_CONFIG, "streaming": False, **openai_overrides}
+    if tools is None:
+        return service_module.AgentService(openai_config, dict(AGENT_CONFIG))
+    
+    registry = MagicMock()
+    registry.get_enabled_tools.return_value = list(tools)
+    with patch.object(service_module, "get_tool_registry", return_value=registry):
+        return service_module.AgentService(openai_config, dict(AGENT_CONFIG))
+
+
+@pytest.fixture
+def mock_mcp_manager():
+    """항상 연결에 성공하는 MCP 클라이언트 관리자 모킹"""
+    manager = MagicMock()
+    manager.initialize = AsyncMock(return_value=True)
+    manager.close = AsyncMock()
+    manager.get_tools.return_value = [remote_echo]
+    manager.get_connection_results.return_value = {"test-server": True}
+    with patch.object(service_module, "mcp_client_manager", manager):
+        yield manager
+
+
+class TestMCPConnection:
+    """MCP 서버 연결/해제 테스트"""
+    
+    def test_connect_reuses_results_while_connected(self, agent_service, mock_mcp_manager):
+        """연결된 상태에서 다시 연결하면 기존 결과를 재사용"""
+        async def scenario():
+            first = await agent_service.connect_mcp_servers()
+            second = await agent_service.connect_mcp_servers()
+            return first, second
+        
+        first, second = asyncio.run(scenario())
+        
+        assert first == second == {"test-server": True}
+        assert mock_mcp_manager.initialize.await_count == 1
+    
+    def test_reconnect_after_disconnect(self, agent_service, mock_mcp_manager):
+        """연결 해제 후 다시 연결하면 MCP 관리자를 다시 초기화하고 도구를 중복 추가하지 않음"""
+        builtin_count = len(agent_service.tools)
+        
+        async def scenario():
+            await agent_service.connect_mcp_servers()
+            await agent_service.disconnect_mcp_servers()
+            return await agent_service.connect_mcp_servers()
+        
+        results = asyncio.run(scenario())
+        
+        assert results == {"test-server": True}
+        assert mock_mcp_manager.initialize.await_count == 2
+        assert mock_mcp_manager.close.await_count == 1
+        tool_names = [t.name for t in agent_service.tools]
+        assert tool_names.count("remote_echo") == 1
+        assert len(agent_service.tools) == builtin_count + 1
+    
+    def test_mcp_tool_runs_through_compiled_app(self, fake_openai_generate, mock_mcp_manager):
+        """연결 후 MCP 도구 호출이 이미 컴파일된 그래프에서 실행됨"""
+        fake_openai_generate.side_effect = remote_echo_generate
+        agent_service = make_service(tools=[current_tick])
+        app = agent_service.app
+        
+        asyncio.run(agent_service.connect_mcp_servers())
+        response, tool_calls = asyncio.run(agent_service.chat("따라 해줘", {"messages": []}))
+        
+        assert agent_service.app is app
+        assert response == "결과: 메아리"
+        assert [call["name"] for call in tool_calls] == ["remote_echo"]
+    
+    def test_failed_integration_keeps_tools_and_binding(self, mock_mcp_manager):
+        """도구 노드 확장에 실패하면 도구 목록과 LLM 바인딩을 바꾸지 않음"""
+        agent_service = make_service(tools=[current_tick])
+        tools = agent_service.tools
+        llm_with_tools = agent_service.llm_with_tools
+        
+        with patch.object(service_module, "ToolNode", side_effect=ValueError("잘못된 도구")):
+            asyncio.run(agent_service.connect_mcp_servers())
+        
+        assert agent_service.tools is tools
+        assert agent_service.llm_with_tools is llm_with_tools
+        assert "remote_echo" not in agent_service.tool_node.tools_by_name
+
+
+class TestServiceCache:
+    """설정별 AgentService 캐시 테스트"""
+    
+    SERVER = {"name": "test-server", "url": "http://localhost:8000/mcp", "enabled": True, "timeout": 30, "headers": {"Authorization": "Bearer a"}}
+    
+    @pytest.fixture(autouse=True)
+    def create_service(self):
+        """서비스 생성 대신 호출마다 새 객체를 반환하도록 모킹"""
+        with patch.object(service_module, "create_agent_service", side_effect=lambda *args: MagicMock()) as create:
+            yield create
+    
+    def test_same_servers_in_any_key_order_reuse_service(self):
+        """서버 설정 dict의 키 순서만 다르면 같은 서비스를 재사용"""
+        reordered = dict(reversed(list(self.SERVER.items())))
+        
+        first = service_module.get_agent_service(OPENAI_CONFIG, AGENT_CONFIG, [self.SERVER])
+        second = service_module.get_agent_service(OPENAI_CONFIG, AGENT_CONFIG, [reordered])
+        
+        assert first is second
+    
+    @pytest.mark.parametrize("change", [
+        {"headers": {"Authorization": "Bearer b"}},
+        {"timeout": 60},
+    ])
+    def test_server_setting_change_creates_new_service(self, change):
+        """서버의 헤더/타임아웃이 바뀌면 새 서비스를 생성"""
+        first = service_module.get_agent_service(OPENAI_CONFIG, AGENT_CONFIG, [self.SERVER])
+        second = service_module.get_agent_service(OPENAI_CONFIG, AGENT_CONFIG, [{**self.SERVER, **change}])
+        
+        assert first is not second
+    
+    def test_cache_keeps_most_recent_services(self):
+        """캐시는 최근 사용한 설정의 서비스만 최대 개수까지 유지"""
+        size = service_module._AGENT_SERVICE_CACHE_SIZE
+        configs = [{**OPENAI_CONFIG, "max_tokens": 100 + index} for index in range(size + 1)]
+        
+        first = service_module.get_agent_service(configs[0], AGENT_CONFIG)
+        for config in configs[1:size]:
+            service_module.get_agent_service(config, AGENT_CONFIG)
+        # 가장 오래된 항목을 다시 사용하면 최근 항목이 되어 남음
+        assert service_module.get_agent_service(configs[0], AGENT_CONFIG) is first
+        service_module.get_agent_service(configs[size], AGENT_CONFIG)
+        
+        assert len(service_module._agent_service_cache) == size
+        assert service_module.get_agent_service(configs[0], AGENT_CONFIG) is first
+
+
+class TestResponseCache:
+    """LLM 응답 캐시 (openai.cache 설정, temperature 0 전용) 테스트"""
+    
+    def test_repeated_request_uses_cache(self, fake_openai_generate):
+        """temperature 0에서 같은 요청을 반복하면 API를 한 번만 호출"""
+        agent_service = make_service(temperature=0, cache=True)
+        
+        first = asyncio.run(agent_service.chat("안녕하세요", {"messages": []}))
+        second = asyncio.run(agent_service.chat("안녕하세요", {"messages": []}))
+        
+        assert first == second == ("테스트 응답", [])
+        assert fake_openai_generate.call_count == 1
+    
+    @pytest.mark.parametrize("overrides", [
+        {"temperature": 0, "cache": False},
+        {"temperature": 0.7, "cache": True},
+    ])
+    def test_cache_disabled(self, fake_openai_generate, overrides):
+        """cache 설정이 꺼져 있거나 temperature가 0이 아니면 매번 API 호출"""
+        agent_service = make_service(**overrides)
+        
+        asyncio.run(agent_service.chat("안녕하세요", {"messages": []}))
+        asyncio.run(agent_service.chat("안녕하세요", {"messages": []}))
+        
+        assert fake_openai_generate.call_count == 2
+    
+    def test_cached_tool_call_still_runs_tool(self, fake_openai_generate):
+        """도구 호출 결정이 캐시되어도 도구는 매번 실행되고 새 결과로 답변"""
+        fake_openai_generate.side_effect = tool_calling_generate
+        tick_calls.reset_mock()
+        agent_service = make_service(tools=[current_tick], temperature=0, cache=True)
+        
+        first_response, first_tool_calls = asyncio.run(agent_service.chat("몇 번째?", {"messages": []}))
+        second_response, second_tool_calls = asyncio.run(agent_service.chat("몇 번째?", {"messages": []}))
+        
+        assert first_response == "결과: tick 1"
+        assert second_response == "결과: tick 2"
+        assert [call["name"] for call in first_tool_calls] == ["current_tick"]
+        assert [call["name"] for call in second_tool_calls] == ["current_tick"]
+        assert tick_calls.call_count == 2
+        # 두 번째 요청의 도구 호출 결정은 캐시에서, 도구 결과 이후 생성만 새로 호출
+        assert fake_openai_generate.call_count == 3
+    
+    def test_cache_key_ignores_only_message_ids(self):
+        """캐시 키에서 메시지 id만 제거하고 도구 호출 id와 본문은 그대로 유지"""
+        def cache_key(messages):
+            cache = service_module._MessageIdInsensitiveCache()
+            cache.update(dumps(messages), "llm", [])
+            return next(iter(cache._cache))[0]
+        
+        tool_call = {"name": "current_tick", "args": {}, "id": "call_1"}
+        first = [HumanMessage(content='"type": "human", "id": "body"', id="uuid-1"), AIMessage(content="", tool_calls=[tool_call], id="uuid-2")]
+        second = [HumanMessage(content='"type": "human", "id": "body"', id="uuid-3"), AIMessage(content="", tool_calls=[tool_call], id="uuid-4")]
+        
+        assert cache_key(first) == cache_key(second)
+        assert '\\"id\\": \\"body\\"' in cache_key(first)
+        assert '"id": "call_1"' in cache_key(first)
+        assert "uuid-" not in cache_key(first)
+
+
+class TestImproveLineBreaks:
+    """응답 마크다운 줄 나눔 정리 테스트"""
+    
+    @pytest.mark.parametrize("text,expected", [
+        # 헤더 앞뒤 빈 줄
+        ("# Title\ntext", "# Title\n\ntext"),
+        ("intro\n## Sub\nbody", "intro\n\n## Sub\n\nbody"),
+        ("# A\n## B\ntext", "# A\n\n## B\n\ntext"),
+        ("# Title\n\ntext", "# Title\n\ntext"),
+        # 굵은 텍스트 앞뒤 공백과 연속 굵은 텍스트 분리
+        ("see**bold**now", "see **bold** now"),
+        ("**a**  and  **b**", "**a** and **b**"),
+        ("**a** **b**", "**a**\n\n**b**"),
+        ("- first\n- **Key**: value", "- first\n\n- **Key** : value"),
+        # 연속된 빈 줄 통합
+        ("a\n\n\nb", "a\n\nb"),
+        ("# T\n\n\n\n\nbody", "# T\n\nbody"),
+    ])
+    def test_formatting(self, agent_service, text, expected):
+        """헤더/굵은 텍스트/빈 줄 정리"""
+        assert agent_service._improve_line_breaks(text) == expected
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("", ""),
+        ("  hello\n\nworld  ", "hello\n\nworld"),
+        ("첫 줄\n둘째 줄", "첫 줄\n둘째 줄"),
+    ])
+    def test_plain_text_only_stripped(self, agent_service, text, expected):
+        """헤더/굵은 텍스트/3줄 이상 빈 줄이 없으면 줄 단위 처리 없이 앞뒤 공백만 제거"""
+        with patch.object(service_module, "_is_markdown_header", side_effect=AssertionError("줄 단위 처리가 실행됨")):
+            assert agent_service._improve_line_breaks(text) == expected
+    
+    @pytest.mark.parametrize("text", [
+        # 줄 중간의 '#'는 헤더가 아님
+        "C# and issue #12\nnext",
+        "#hashtag line",
+        # 헤더 레벨은 6까지만 인정
+        "####### seven\ntext",
+        # 줄을 넘어가는 '**'는 굵은 텍스트로 짝짓지 않음
+        "**open\nclose**",
+        # 굵은 텍스트 앞뒤 줄바꿈은 공백으로 합치지 않음
+        "text\n**bold**",
+        "a **b**\nc",
+    ])
+    def test_edge_cases_left_intact(self, agent_service, text):
+        """정규식 버전이 줄을 넘어 잘못 처리하던 경우는 원문 유지"""
+        assert agent_service._improve_line_breaks(text) == text
+
+
+def collect_stream(agent_service, user_input, conversation_state):
+    """chat_stream_with_workflow의 모든 청크를 모아 반환"""
+    async def collect():
+        return [chunk async for chunk in agent_service.chat_stream_with_workflow(user_input, conversation_state)]
+    return asyncio.run(collect())
+
+
+def streamed_text(chunks):
+    """text 청크를 이어 붙인 문자열"""
+    return "".join(chunk["data"] for chunk in chunks if chunk["type"] == "text")
+
+
+class TestStreaming:
+    """워크플로우 스트리밍 테스트 (가짜 채팅 모델 사용)"""
+    
+    def test_tokens_streamed_from_model(self):
+        """모델이 토큰을 스트리밍하면 토큰을 그대로 전달하고 완성 응답을 다시 나눠 보내지 않음"""
+        agent_service = make_service(temperature=0.7, streaming=True)
+        agent_service.llm_with_tools = FakeStreamingChatModel(responses=[AIMessage(content="안녕하세요 반갑습니다 테스트")])
+        conversation_state = {"messages": []}
+        
+        chunks = collect_stream(agent_service, "안녕", conversation_state)
+        
+        text_chunks = [chunk["data"] for chunk in chunks if chunk["type"] == "text"]
+        assert text_chunks == ["안녕하세요", " ", "반갑습니다", " ", "테스트"]
+        assert not any(chunk["type"] == "ai_response_ready" for chunk in chunks)
+        assert chunks[-1] == {"type": "streaming_complete", "data": {"final_response": "안녕하세요 반갑습니다 테스트"}}
+        assert [message.type for message in conversation_state["messages"]] == ["system", "human", "ai"]
+    
+    def test_fallback_when_model_does_not_stream(self):
+        """모델이 토큰을 스트리밍하지 않으면 완성된 응답을 묶음 단위로 나눠 전달"""
+        response = " ".join(f"단어{index}" for index in range(40))
+        agent_service = make_service(temperature=0.7, streaming=True)
+        agent_service.llm_with_tools = FakeStreamingChatModel(responses=[AIMessage(content=response)], disable_streaming=True)
+        
+        chunks = collect_stream(agent_service, "안녕", {"messages": []})
+        
+        text_chunks = [chunk["data"] for chunk in chunks if chunk["type"] == "text"]
+        assert [chunk["type"] for chunk in chunks][0] == "ai_response_ready"
+        assert "".join(text_chunks) == response
+        # 단어마다가 아니라 최소 길이 단위로 묶어서 전달
+        assert 1 < len(text_chunks) < len(response.split())
+        assert all(len(chunk) >= service_module._FALLBACK_CHUNK_CHARS for chunk in text_chunks[:-1])
+        assert chunks[-1]["type"] == "streaming_complete"
+    
+    def test_tool_call_announced_once(self):
+        """도구 호출 턴은 도구를 한 번만 알리고 도구 결과 이후의 토큰을 스트리밍"""
+        tick_calls.reset_mock()
+        agent_service = make_service(tools=[current_tick], temperature=0.7, streaming=True)
+        agent_service.llm_with_tools = FakeStreamingChatModel(responses=[
+            AIMessage(content="", tool_calls=[{"name": "current_tick", "args": {}, "id": "call_1"}]),
+            AIMessage(content="결과는 tick 1 입니다"),
+        ])
+        conversation_state = {"messages": []}
+        
+        chunks = collect_stream(agent_service, "몇 번째?", conversation_state)
+        
+        pending = [chunk for chunk in chunks if chunk["type"] == "tools_pending"]
+        executing = [chunk for chunk in chunks if chunk["type"] == "tool_executing"]
+        assert len(pending) == 1
+        assert [call["name"] for call in pending[0]["data"]["tool_calls"]] == ["current_tick"]
+        assert [chunk["data"]["tool_name"] for chunk in executing] == ["current_tick"]
+        assert tick_calls.call_count == 1
+        assert streamed_text(chunks) == "결과는 tick 1 입니다"
+        assert chunks[-1] == {"type": "streaming_complete", "data": {"final_response": "결과는 tick 1 입니다"}}
+        assert [message.type for message in conversation_state["messages"]] == ["system", "human", "ai", "tool", "ai"]
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("Use **bold text** and `code span` now\nnext *it x*",
+         ["Use ", "**bold text** ", "and ", "`code span` ", "now\n", "next ", "*it x*"]),
+        ("plain words  here\n", ["plain ", "words  ", "here\n"]),
+    ])
+    def test_smart_split_keeps_markdown_spans(self, agent_service, text, expected):
+        """분할 조각은 마크다운 구문을 나누지 않고, 이어 붙이면 원문과 같음"""
+        chunks = list(agent_service._smart_split_for_streaming(text))
+        assert chunks == expected
+        assert "".join(chunks) == text
+
+
+def echo_generate(messages, *args, **kwargs):
+    """마지막 사용자 메시지를 그대로 답하는 가짜 모델"""
+    return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"답변: {messages[-1].content}"))])
+
+
+class TestChatBatch:
+    """여러 입력 동시 처리 테스트"""
+    
+    def test_failure_keeps_position(self, fake_openai_generate):
+        """한 입력의 워크플로우가 실패해도 그 자리에 오류 메시지를 두고 나머지 입력은 정상 처리"""
+        fake_openai_generate.side_effect = echo_generate
+        process_input = service_module.AgentService._process_input
+        
+        def failing_process_input(self, state):
+            if state["user_input"] == "실패":
+                raise RuntimeError("workflow failed")
+            return process_input(self, state)
+        
+        with patch.object(service_module.AgentService, "_process_input", failing_process_input):
+            agent_service = make_service(temperature=0.7)
+        
+        results = asyncio.run(agent_service.chat_batch(["첫째", "실패", "셋째"], max_concurrency=2))
+        
+        assert results == [
+            ("답변: 첫째", []),
+            (service_module._REQUEST_ERROR_MESSAGE, []),
+            ("답변: 셋째", []),
+        ]
+        assert fake_openai_generate.call_count == 2
@@ -0,0 +1,90 @@
+"""Unit tests for settings file checks"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from my_mcp import config
+# 상위 conftest가 config.check_settings를 모킹하므로 실제 함수를 미리 가져옴
+from my_mcp.config import check_settings
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    """검증 상태를 초기화하고 임시 설정 파일과 설정 객체를 사용"""
+    path = tmp_path / "settings.yaml"
+    path.write_text("openai:\n  api_key: test-api-key\n", encoding="utf-8")
+    mock_settings = MagicMock()
+    mock_settings.openai.api_key = "test-api-key"
+    with patch.object(config, "SETTINGS_FILE", path), \
+         patch.object(config, "settings", mock_settings), \
+         patch.object(config, "_checked_settings_mtime_ns", None), \
+         patch.object(config, "_settings_valid", False):
+        yield path, mock_settings
+
+
+def touch(path):
+    """설정 파일 mtime을 1초 뒤로 변경"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCheckSettings:
+    """설정 파일 확인 결과 캐시 테스트"""
+    
+    def test_valid_result_is_reused_until_file_changes(self, settings_file):
+        """파일이 그대로면 검증을 다시 하지 않고, 바뀌면 설정을 다시 읽음"""
+        path, mock_settings = settings_file
+        
+        with patch.object(config, "_validate_settings", wraps=config._validate_settings) as validate:
+            assert check_settings() is True
+            assert check_settings() is True
+            assert validate.call_count == 1
+            mock_settings.reload.assert_not_called()
+            
+            touch(path)
+            assert check_settings() is True
+            assert validate.call_count == 2
+            mock_settings.reload.assert_called_once()
+    
+    def test_reload_clears_config_caches(self, settings_file):
+        """설정 파일이 바뀌면 설정 값 캐시도 비움"""
+        path, _ = settings_file
+        check_settings()
+        
+        with patch.object(config, "get_openai_config") as openai_config, \
+             patch.object(config, "get_chatbot_config") as chatbot_config, \
+             patch.object(config, "_load_mcp_servers") as mcp_servers:
+            touch(path)
+            check_settings()
+        
+        openai_config.cache_clear.assert_called_once()
+        chatbot_config.cache_clear.assert_called_once()
+        mcp_servers.cache_clear.assert_called_once()
+    
+    def test_failure_is_not_cached(self, settings_file):
+        """검증 실패는 캐시하지 않아 호출할 때마다 오류를 안내"""
+        _, mock_settings = settings_file
+        mock_settings.openai.api_key = "your-openai-api-key-here"
+        
+        with patch.object(config, "logger") as logger:
+            assert check_settings() is False
+            assert check_settings() is False
+        
+        assert logger.error.call_count == 2
+        
+        # 같은 파일이어도 설정이 고쳐지면 바로 통과
+        mock_settings.openai.api_key = "test-api-key"
+        assert check_settings() is True
+    
+    def test_missing_file_then_created_reloads(self, settings_file):
+        """파일이 없다가 생기면 설정을 다시 읽음"""
+        path, mock_settings = settings_file
+        path.unlink()
+        
+        assert check_settings() is False
+        
+        path.write_text("openai:\n  api_key: test-api-key\n", encoding="utf-8")
+        assert check_settings() is True
+        mock_settings.reload.assert_called_once()
@@ -0,0 +1,64 @@
+"""Unit tests for Mermaid diagram generation"""
+
+import pytest
+
+from my_mcp.utils import diagram_utils
+from my_mcp.utils.diagram_utils import generate_mermaid_diagram
+
+
+class TestMermaidNames:
+    """Mermaid 노드 ID/라벨 정리 테스트"""
+    
+    @pytest.mark.parametrize("name,expected", [
+        ("process_input", "process_input"),
+        ("my node", "my_node"),
+        ("mcp-server.get-time", "mcp_server_get_time"),
+        ('say "hi"', "say__hi_"),
+        ("it's", "it_s"),
+        ("list[int]", "list_int_"),
+        ("call(x)", "call_x_"),
+        ("{json}", "_json_"),
+        ("한글 도구", "한글_도구"),
+    ])
+    def test_mermaid_id(self, name, expected):
+        """ID로 쓸 수 없는 문자는 밑줄로 바뀜"""
+        assert diagram_utils._mermaid_id(name) == expected
+    
+    @pytest.mark.parametrize("name,expected", [
+        ("my node", "my node"),
+        ("get-time", "get-time"),
+        ('say "hi"', "say 'hi'"),
+        ("list[int]", "list[int]"),
+        ("첫 줄\n둘째 줄", "첫 줄 둘째 줄"),
+    ])
+    def test_mermaid_label(self, name, expected):
+        """라벨은 큰따옴표와 줄바꿈만 치환하고 나머지는 그대로 표시"""
+        assert diagram_utils._mermaid_label(name) == expected
+    
+    def test_diagram_uses_same_ids_for_nodes_edges_and_tools(self):
+        """노드 정의, 엣지, 도구 연결이 모두 같은 정리된 ID를 사용"""
+        nodes = ["__start__", "my node", 'quote "node"', "call_tools", "__end__"]
+        edges = [("__start__", "my node"), ("my node", 'quote "node"'), ('quote "node"', "call_tools"), ("call_tools", "__end__")]
+        tools = [
+            {"name": "get-time", "type": "basic"},
+            {"name": "search[v2]", "type": "mcp", "server": 'server "a"'},
+        ]
+        
+        lines = generate_mermaid_diagram(nodes, edges, tools).splitlines()
+        
+        assert lines[:8] == [
+            "graph TD",
+            '    __start__(["\\_\\_start\\_\\_"])',
+            '    my_node["my node"]',
+            '    quote__node_["quote \'node\'"]',
+            '    call_tools["call_tools"]',
+            '    __end__(["\\_\\_end\\_\\_"])',
+            '    get_time["get-time"]',
+            '    search_v2_["search[v2]<br/>(server \'a\')"]',
+        ]
+        assert "    __start__ --> my_node" in lines
+        assert "    my_node --> quote__node_" in lines
+        assert "    quote__node_ --> call_tools" in lines
+        assert "    call_tools --> get_time" in lines
+        assert "    call_tools --> search_v2_" in lines
+        assert lines[-2:] == ["    class get_time basicTool", "    class search_v2_ mcpTool"]
@@ -0,0 +1,54 @@
+"""Unit tests for ExportCommand JSON export"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from my_mcp.commands import export as export_module
+from my_mcp.commands.export import ExportCommand
+
+
+@pytest.fixture(autouse=True)
+def mock_console():
+    """저장 결과 메시지 출력 모킹"""
+    with patch.object(export_module, "console") as console:
+        yield console
+
+
+class TestExportJson:
+    """그래프 JSON 내보내기 테스트"""
+    
+    def test_exported_file_is_valid_json(self, tmp_path):
+        """따옴표/줄바꿈/비 ASCII 문자가 있는 도구 설명도 올바른 JSON으로 저장"""
+        nodes = ["__start__", "process_input", "generate_response", "__end__"]
+        edges = [("__start__", "process_input"), ("process_input", "generate_response"), ("generate_response", "__end__")]
+        tools = [
+            {"name": 'say_"hi"', "description": '첫 줄\n"인용" \\ 백슬래시\t탭 😀', "type": "basic"},
+            {"name": "server/lookup", "description": "설명 없음", "type": "mcp", "server": "test-server"},
+        ]
+        output = tmp_path / "graph" / "diagram.json"
+        
+        ExportCommand({}, {})._export_json(nodes, edges, tools, None, str(output))
+        
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["nodes"] == [{"id": node, "type": "node", "label": node} for node in nodes]
+        assert data["edges"] == [{"source": source, "target": target} for source, target in edges]
+        assert data["tools"] == [
+            {"name": 'say_"hi"', "description": '첫 줄\n"인용" \\ 백슬래시\t탭 😀', "type": "tool"},
+            {"name": "server/lookup", "description": "설명 없음", "type": "tool"},
+        ]
+        assert data["workflow"] == "LangGraph Assistant"
+        assert data["description"]
+        # 비 ASCII 문자는 이스케이프하지 않고 그대로 저장
+        assert "첫 줄" in output.read_text(encoding="utf-8")
+    
+    def test_empty_tools_and_description(self, tmp_path):
+        """도구가 없으면 빈 배열, 설명이 주어지면 그대로 저장"""
+        output = tmp_path / "diagram.json"
+        
+        ExportCommand({}, {})._export_json(["__start__", "__end__"], [("__start__", "__end__")], [], '설명 "따옴표"\n두 줄', str(output))
+        
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["tools"] == []
+        assert data["description"] == '설명 "따옴표"\n두 줄'
@@ -0,0 +1,86 @@
+"""Unit tests for ConversationMarkdownWriter"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from my_mcp.utils import markdown_utils
+from my_mcp.utils.markdown_utils import ConversationMarkdownWriter
+
+
+@pytest.fixture
+def mock_console():
+    """저장 결과 메시지 확인용 콘솔 모킹"""
+    with patch.object(markdown_utils, "console") as console:
+        yield console
+
+
+def printed_messages(console: MagicMock) -> str:
+    """콘솔에 출력된 메시지를 하나의 문자열로 반환"""
+    return "\n".join(str(call.args[0]) for call in console.print.call_args_list)
+
+
+class TestConversationMarkdownWriter:
+    """대화 기록 파일 작성기 테스트"""
+    
+    def test_appends_each_turn_immediately(self, tmp_path, mock_console):
+        """턴마다 파일에 바로 반영되고 닫을 때 저장 완료를 알림"""
+        writer = ConversationMarkdownWriter(str(tmp_path / "chat"))
+        filename = tmp_path / "chat.md"
+        
+        # 첫 기록 전에는 파일을 만들지 않음
+        assert not filename.exists()
+        
+        writer.write_turn("첫 질문", "첫 답변\n여러 줄")
+        first = filename.read_text(encoding="utf-8")
+        assert first.startswith("# AI 대화 기록\n\n")
+        assert first.endswith("**사용자**: 첫 질문\n\n**AI**: 첫 답변\n여러 줄\n\n")
+        
+        writer.write_turn("둘째 질문", "둘째 답변")
+        second = filename.read_text(encoding="utf-8")
+        assert second == first + "**사용자**: 둘째 질문\n\n**AI**: 둘째 답변\n\n"
+        
+        writer.close()
+        assert filename.read_text(encoding="utf-8") == second
+        assert "저장되었습니다" in printed_messages(mock_console)
+    
+    def test_close_without_turns(self, tmp_path, mock_console):
+        """기록한 대화가 없으면 파일을 만들지 않고 아무것도 출력하지 않음"""
+        with ConversationMarkdownWriter(str(tmp_path / "empty.md")):
+            pass
+        
+        assert not (tmp_path / "empty.md").exists()
+        mock_console.print.assert_not_called()
+    
+    def test_open_failure_stops_recording(self, tmp_path, mock_console):
+        """파일을 열 수 없으면 실패를 한 번만 알리고 이후 대화는 기록하지 않음"""
+        writer = ConversationMarkdownWriter(str(tmp_path / "missing" / "chat.md"))
+        
+        writer.write_turn("질문", "답변")
+        writer.write_turn("질문", "답변")
+        writer.close()
+        
+        assert mock_console.print.call_count == 1
+        assert "파일 저장 실패" in printed_messages(mock_console)
+    
+    def test_close_after_write_error(self, tmp_path, mock_console):
+        """기록 중 오류가 나면 파일은 닫되 저장 완료 메시지는 출력하지 않음"""
+        writer = ConversationMarkdownWriter(str(tmp_path / "chat.md"))
+        writer.write_turn("첫 질문", "첫 답변")
+        
+        real_file = writer._file
+        failing_file = MagicMock(wraps=real_file)
+        failing_file.write.side_effect = OSError("disk full")
+        writer._file = failing_file
+        
+        writer.write_turn("둘째 질문", "둘째 답변")
+        writer.write_turn("셋째 질문", "셋째 답변")
+        writer.close()
+        
+        assert failing_file.write.call_count == 1
+        assert real_file.closed
+        assert writer._file is None
+        messages = printed_messages(mock_console)
+        assert "파일 저장 실패: disk full" in messages
+        assert "저장되었습니다" not in messages
+        assert "첫 답변" in (tmp_path / "chat.md").read_text(encoding="utf-8")
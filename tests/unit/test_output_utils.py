@@ -0,0 +1,104 @@
+"""Unit tests for JSON/YAML output serialization"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from my_mcp.utils import output_utils
+
+
+# 직렬화가 까다로운 메시지 (따옴표, 줄바꿈, YAML 특수문자, 비 ASCII)
+MESSAGES = [
+    "간단한 메시지",
+    'say "hello" and \'bye\'',
+    "첫 줄\n둘째 줄\n",
+    "key: value",
+    "# 주석처럼 보이는 값",
+    "- 목록처럼 보이는 값",
+    "tab\there \\ backslash",
+    "이모지 🎉 와 日本語",
+    "",
+    "null",
+    "true",
+    "123",
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request):
+    """orjson이 있을 때와 없을 때 (json.dumps 폴백) 모두 실행"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch.object(output_utils, "orjson", None):
+            yield
+
+
+@pytest.fixture(params=["pyyaml", "builtin"])
+def yaml_backend(request):
+    """PyYAML이 있을 때와 없을 때 (내장 변환) 모두 실행"""
+    if request.param == "pyyaml":
+        yield
+    else:
+        with patch.object(output_utils, "_get_yaml", return_value=None):
+            yield
+
+
+class TestJsonOutput:
+    """JSON 출력 테스트"""
+    
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_emit_json_round_trip(self, json_backend, capsysbinary, message):
+        """출력된 JSON을 다시 읽으면 같은 메시지가 나오고, 들여쓰기 2칸 dict 직렬화와 같은 바이트"""
+        output_utils._emit_json(None, message)
+        output = capsysbinary.readouterr().out
+        
+        expected = {"message": message, "status": "success"}
+        assert json.loads(output) == expected
+        assert output == output_utils.to_json_bytes(expected) + b"\n"
+    
+    def test_non_ascii_is_not_escaped(self, json_backend, capsysbinary):
+        """비 ASCII 문자는 \\u 이스케이프 없이 UTF-8로 출력"""
+        output_utils._emit_json(None, "안녕 🎉")
+        
+        assert "안녕 🎉".encode("utf-8") in capsysbinary.readouterr().out
+
+
+class TestYamlOutput:
+    """YAML 출력 테스트"""
+    
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_emit_yaml_round_trip(self, yaml_backend, capsysbinary, message):
+        """출력된 YAML을 다시 읽으면 같은 메시지가 나옴"""
+        output_utils._emit_yaml(None, message)
+        output = capsysbinary.readouterr().out.decode("utf-8")
+        
+        assert yaml.safe_load(output) == {"message": message, "status": "success"}
+    
+    def test_to_yaml_round_trip_nested(self, yaml_backend):
+        """중첩 dict와 문자열이 아닌 값도 그대로 다시 읽힘 (키 순서 유지)"""
+        data = {
+            "name": "my-mcp: 테스트",
+            "version": "1.0",
+            "enabled": True,
+            "count": 3,
+            "ratio": 0.5,
+            "missing": None,
+            "tags": ["a", "b: c"],
+            "empty": {},
+            "server": {"url": "http://localhost:8000/mcp", "headers": {"Authorization": "Bearer #token"}},
+        }
+        output = output_utils.to_yaml(data)
+        
+        loaded = yaml.safe_load(output)
+        assert loaded == data
+        assert list(loaded) == list(data)
+    
+    def test_yaml_lines_nests_dicts_as_blocks(self):
+        """내장 변환은 중첩 dict를 들여쓰기 블록으로, 값은 인용해서 출력"""
+        lines = list(output_utils._yaml_lines({"outer": {"inner": "값: #1"}, "flag": False}))
+        
+        assert lines == ['outer:', '  inner: "값: #1"', 'flag: false']